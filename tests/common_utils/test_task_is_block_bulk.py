@@ -0,0 +1,72 @@
+from collections.abc import Callable
+import time
+
+from nonebug import App
+
+from tests.config import BotId
+
+TASK_MODULE = "test_task"
+
+
+async def test_task_is_block_bulk_matches_task_is_block(
+    app: App,
+    create_bot: Callable,
+) -> None:
+    """
+    测试批量被动禁用判断与逐个调用 task_is_block 结果一致
+    """
+    from zhenxun.models.ban_console import BanConsole
+    from zhenxun.models.bot_console import BotConsole
+    from zhenxun.models.group_console import GroupConsole, add_disable_marker
+    from zhenxun.utils.common_utils import CommonUtils
+
+    marker = add_disable_marker(TASK_MODULE)
+    now = int(time.time())
+
+    await BotConsole.create(bot_id=str(BotId.QQ_BOT), status=True)
+    # 普通禁用 / 超级用户禁用 / 群权限小于0
+    # create 会按默认关闭的被动重写 block_task，因此创建后再写入禁用标记
+    await GroupConsole.create(group_id="30001")
+    await GroupConsole.filter(group_id="30001").update(block_task=marker)
+    await GroupConsole.create(group_id="30002")
+    await GroupConsole.filter(group_id="30002").update(superuser_block_task=marker)
+    await GroupConsole.create(group_id="30003", level=-1)
+    # 重复记录时以最新的一条为准
+    await GroupConsole.create(group_id="30004", level=-1)
+    await GroupConsole.create(group_id="30004", level=5)
+    # 永久ban / 已过期的ban / 正常群组
+    await GroupConsole.create(group_id="30005")
+    await BanConsole.create(
+        user_id="",
+        group_id="30005",
+        ban_level=9,
+        ban_time=now,
+        duration=-1,
+        operator="test",
+    )
+    await GroupConsole.create(group_id="30006")
+    await BanConsole.create(
+        user_id="",
+        group_id="30006",
+        ban_level=9,
+        ban_time=now - 100,
+        duration=10,
+        operator="test",
+    )
+    await GroupConsole.create(group_id="30007")
+    group_ids = [f"3000{i}" for i in range(1, 9)]
+
+    async with app.test_api() as ctx:
+        bot = create_bot(ctx)
+
+        bulk_blocked = await CommonUtils.task_is_block_bulk(bot, TASK_MODULE, group_ids)
+        # 已过期的ban记录与逐个判断时一样会被删除
+        assert not await BanConsole.exists(user_id="", group_id="30006")
+
+        single_blocked = {
+            group_id
+            for group_id in group_ids
+            if await CommonUtils.task_is_block(bot, TASK_MODULE, group_id)
+        }
+
+    assert bulk_blocked == single_blocked == {"30001", "30002", "30003", "30005"}
@@ -0,0 +1,65 @@
+from collections.abc import Callable
+
+from nonebug import App
+from pydantic import BaseModel
+
+from tests.config import BotId
+
+PLUGIN_NAME = "test_scheduler_params"
+
+
+class JobParams(BaseModel):
+    tags: list[str] = []
+
+
+async def test_job_params_isolated_between_runs(
+    app: App,
+    create_bot: Callable,
+) -> None:
+    """
+    测试任务修改注入的参数不会影响后续触发与其他目标
+    """
+    from zhenxun.models.bot_console import BotConsole
+    from zhenxun.models.scheduled_job import ScheduledJob
+    from zhenxun.services.scheduler.engine import (
+        _execute_single_job_instance,
+        _split_execution_policy,
+        _validate_job_params,
+    )
+
+    schedule = ScheduledJob(
+        id=10001,
+        plugin_name=PLUGIN_NAME,
+        target_type="GLOBAL",
+        target_identifier="__ALL_GROUPS__",
+        trigger_type="interval",
+        trigger_config={"seconds": 60},
+        job_kwargs={"tags": ["a"]},
+    )
+    task_meta = {"model": JobParams}
+    await BotConsole.create(bot_id=str(BotId.QQ_BOT), status=True)
+    received: list[list[str]] = []
+
+    async def task(bot, context, params: JobParams):
+        received.append(list(params.tags))
+        params.tags.append("mutated")
+
+    async with app.test_api() as ctx:
+        bot = create_bot(ctx)
+        for _ in range(2):
+            policy, job_kwargs = _split_execution_policy(schedule)
+            params = _validate_job_params(schedule, task_meta, job_kwargs)
+            for group_id in ("40001", "40002"):
+                await _execute_single_job_instance(
+                    schedule,
+                    bot,
+                    group_id,
+                    func=task,
+                    params=params,
+                    policy=policy,
+                    job_kwargs=job_kwargs,
+                )
+
+    assert received == [["a"]] * 4
+    assert params is not None
+    assert params.tags == ["a"]
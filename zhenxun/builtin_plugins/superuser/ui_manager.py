@@ -48,6 +48,22 @@ __plugin_meta__ = PluginMetadata(
                 default_value=True,
                 type=bool,
             ),
+            RegisterConfig(
+                module="UI",
+                key="TEMPLATE_BYTECODE_CACHE",
+                value=True,
+                help="是否启用Jinja2模板字节码缓存，跨重启复用模板编译结果",
+                default_value=True,
+                type=bool,
+            ),
+            RegisterConfig(
+                module="UI",
+                key="TEMPLATE_WARMUP",
+                value=False,
+                help="是否在加载主题时预编译全部模板，以降低首次渲染延迟",
+                default_value=False,
+                type=bool,
+            ),
             RegisterConfig(
                 module="UI",
                 key="DEBUG_MODE",
@@ -18,6 +18,8 @@ TEMP_PATH = Path() / "resources" / "temp"
 THEMES_PATH = Path() / "resources" / "themes"
 # [新增] UI渲染服务的统一缓存路径
 UI_CACHE_PATH = TEMP_PATH / "ui_cache"
+# Jinja2 模板字节码缓存路径
+JINJA_BYTECODE_CACHE_PATH = DATA_PATH / "cache" / "jinja_bytecode"
 
 
 IMAGE_PATH.mkdir(parents=True, exist_ok=True)
@@ -28,3 +30,4 @@ FONT_PATH.mkdir(parents=True, exist_ok=True)
 DATA_PATH.mkdir(parents=True, exist_ok=True)
 TEMP_PATH.mkdir(parents=True, exist_ok=True)
 UI_CACHE_PATH.mkdir(parents=True, exist_ok=True)
+JINJA_BYTECODE_CACHE_PATH.mkdir(parents=True, exist_ok=True)
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 import time
 from typing import ClassVar
 from typing_extensions import Self
@@ -108,14 +109,50 @@ class BanConsole(Model):
         if not user and user_id:
             user = await cls._get_data(user_id, None)
         if user:
-            if user.duration == -1:
-                return -1
-            _time = time.time() - (user.ban_time + user.duration)
-            if _time < 0:
-                return int(abs(_time))
+            if remaining := cls._remaining_ban_time(user.ban_time, user.duration):
+                return remaining
             await user.delete()
         return 0
 
+    @staticmethod
+    def _remaining_ban_time(ban_time: int, duration: int) -> int:
+        """计算ban剩余时长
+
+        参数:
+            ban_time: ban开始的时间
+            duration: ban时长
+
+        返回:
+            int: ban剩余时长，-1时为永久ban，0表示已过期
+        """
+        if duration == -1:
+            return -1
+        _time = time.time() - (ban_time + duration)
+        return int(abs(_time)) if _time < 0 else 0
+
+    @classmethod
+    async def get_banned_groups(cls, group_ids: Iterable[str]) -> set[str]:
+        """批量判断群组是否被ban，与逐个调用 `is_ban(None, group_id)` 结果一致
+
+        已过期的ban记录会与 `check_ban_time` 一样被删除
+
+        参数:
+            group_ids: 群组id列表
+
+        返回:
+            set[str]: 被ban的群组id
+        """
+        group_ids = list(group_ids)
+        if not group_ids:
+            return set()
+        banned: set[str] = set()
+        for ban in await cls.filter(user_id="", group_id__in=group_ids).all():
+            if cls._remaining_ban_time(ban.ban_time, ban.duration):
+                banned.add(ban.group_id)
+            else:
+                await ban.delete()
+        return banned
+
     @classmethod
     async def is_ban(cls, user_id: str | None, group_id: str | None = None) -> bool:
         """判断用户是否被ban
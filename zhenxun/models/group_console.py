@@ -1,8 +1,10 @@
+from collections.abc import Iterable
 from typing import Any, ClassVar, cast, overload
 from typing_extensions import Self
 
 from tortoise import fields
 from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.expressions import Q
 
 from zhenxun.models.plugin_info import PluginInfo
 from zhenxun.models.task_info import TaskInfo
@@ -445,13 +447,9 @@ class GroupConsole(Model):
         task = add_disable_marker(task)
         if not channel_id:
             return await cls.exists(
+                cls._block_task_filter(task),
                 group_id=group_id,
                 channel_id__isnull=True,
-                block_task__contains=task,
-            ) or await cls.exists(
-                group_id=group_id,
-                channel_id__isnull=True,
-                superuser_block_task__contains=task,
             )
         return await cls.exists(
             group_id=group_id, channel_id=channel_id, block_task__contains=task
@@ -461,6 +459,77 @@ class GroupConsole(Model):
             superuser_block_task__contains=task,
         )
 
+    @staticmethod
+    def _block_task_filter(task_marker: str) -> Q:
+        """群组禁用被动的查询条件(普通禁用或超级用户禁用)
+
+        参数:
+            task_marker: 添加了禁用标记的任务模块
+
+        返回:
+            Q: 查询条件
+        """
+        return Q(block_task__contains=task_marker) | Q(
+            superuser_block_task__contains=task_marker
+        )
+
+    @classmethod
+    async def get_block_task_groups(
+        cls, group_ids: Iterable[str], task: str
+    ) -> set[str]:
+        """批量查看禁用被动的群组，判断条件与不指定频道的 `is_block_task` 相同
+
+        参数:
+            group_ids: 群组id列表
+            task: 任务模块
+
+        返回:
+            set[str]: 禁用了该被动的群组id
+        """
+        group_ids = list(group_ids)
+        if not group_ids:
+            return set()
+        rows = await cls.filter(
+            cls._block_task_filter(add_disable_marker(task)),
+            group_id__in=group_ids,
+            channel_id__isnull=True,
+        ).values_list("group_id", flat=True)
+        return set(rows)  # type: ignore
+
+    @staticmethod
+    def is_level_blocked(level: int) -> bool:
+        """群组权限是否小于0(此时群组不响应被动)"""
+        return level < 0
+
+    @classmethod
+    async def get_level_blocked_groups(cls, group_ids: Iterable[str]) -> set[str]:
+        """批量查看权限小于0的群组
+
+        与 `get_group` 一致，存在重复记录时只以最新(id最大)的一条为准，
+        此处仅读取，不清理重复记录
+
+        参数:
+            group_ids: 群组id列表
+
+        返回:
+            set[str]: 权限小于0的群组id
+        """
+        group_ids = list(group_ids)
+        if not group_ids:
+            return set()
+        latest: dict[str, tuple[int, int]] = {}
+        for row_id, group_id, level in await cls.filter(
+            group_id__in=group_ids, channel_id__isnull=True
+        ).values_list("id", "group_id", "level"):
+            current = latest.get(group_id)
+            if current is None or row_id > current[0]:
+                latest[group_id] = (row_id, level)
+        return {
+            group_id
+            for group_id, (_, level) in latest.items()
+            if cls.is_level_blocked(level)
+        }
+
     @classmethod
     async def set_block_task(
         cls,
@@ -54,3 +54,13 @@ class ScheduledJob(Model):
     class Meta:  # type: ignore
         table = "scheduled_tasks"
         table_description = "通用定时任务定义表"
+        indexes = [("plugin_name", "target_identifier")]  # noqa: RUF012
+
+    @classmethod
+    async def _run_script(cls):
+        return [
+            # 为已有数据表补建 Meta.indexes 中的索引，新库由 generate_schemas 创建；
+            # 索引名与 tortoise 生成的名称一致，已存在时语句报错并被忽略，不会重复建索引
+            "CREATE INDEX idx_scheduled_t_plugin__8d8fb3"
+            " ON scheduled_tasks(plugin_name, target_identifier);",
+        ]
@@ -15,6 +15,9 @@ from zhenxun.configs.path_config import LOG_PATH
 driver = nonebot.get_driver()
 
 log_level = driver.config.log_level or "INFO"
+_min_level_no = (
+    log_level if isinstance(log_level, int) else logger_.level(log_level.upper()).no
+)
 
 logger_.add(
     LOG_PATH / "{time:YYYY-MM-DD}.log",
@@ -79,6 +82,19 @@ class logger:
         parts.append(info)
         return " ".join(parts)
 
+    @classmethod
+    def is_enabled_for(cls, level: str) -> bool:
+        """
+        判断指定级别的日志是否会被输出，用于在热路径上跳过日志内容的构建。
+
+        参数:
+            level: 日志级别名称，如 "DEBUG"。
+
+        返回:
+            bool: 是否会被输出。
+        """
+        return logger_.level(level.upper()).no >= _min_level_no
+
     @classmethod
     def _log(
         cls,
@@ -2,12 +2,17 @@
 渲染器服务的共享配置和常量
 """
 
-RESERVED_TEMPLATE_KEYS: set[str] = {
-    "data",
-    "theme",
-    "theme_css",
-    "extra_css",
-    "required_scripts",
-    "required_styles",
-    "frameless",
-}
+RESERVED_TEMPLATE_KEYS: frozenset[str] = frozenset(
+    {
+        "data",
+        "theme",
+        "theme_css",
+        "extra_css",
+        "required_scripts",
+        "required_styles",
+        "frameless",
+    }
+)
+
+# 模板上下文中保存当前 RenderContext 的变量名，供嵌套组件渲染复用缓存
+RENDER_CONTEXT_KEY = "__render_context__"
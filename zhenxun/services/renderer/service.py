@@ -10,6 +10,7 @@ import aiofiles
 from jinja2 import (
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     PrefixLoader,
     TemplateNotFound,
@@ -19,13 +20,17 @@ from nonebot.utils import is_coroutine_callable
 import ujson as json
 
 from zhenxun.configs.config import Config
-from zhenxun.configs.path_config import THEMES_PATH, UI_CACHE_PATH
+from zhenxun.configs.path_config import (
+    JINJA_BYTECODE_CACHE_PATH,
+    THEMES_PATH,
+    UI_CACHE_PATH,
+)
 from zhenxun.services.log import logger
 from zhenxun.utils.exception import RenderingError
 from zhenxun.utils.log_sanitizer import sanitize_for_logging
 from zhenxun.utils.pydantic_compat import _dump_pydantic_obj
 
-from .config import RESERVED_TEMPLATE_KEYS
+from .config import RENDER_CONTEXT_KEY, RESERVED_TEMPLATE_KEYS
 from .engine import get_screenshot_engine
 from .protocols import Renderable, RenderResult, ScreenshotEngine
 from .registry import asset_registry
@@ -85,6 +90,7 @@ class RendererService:
         - PrefixLoader：用于插件模板的命名空间加载
         - FileSystemLoader：用于主题模板的文件系统加载
         - RelativePathEnvironment：支持模板间相对路径引用的自定义环境
+        - FileSystemBytecodeCache：(可配置) 跨重启复用模板的编译结果
 
         返回:
             Environment: 完全配置好的 Jinja2 环境实例，准备接收自定义过滤器和全局函数。
@@ -98,12 +104,21 @@ class RendererService:
         theme_loader = FileSystemLoader(str(THEMES_PATH / "default"))
         final_loader = ChoiceLoader([prefix_loader, theme_loader])
 
+        bytecode_cache = None
+        if Config.get_config("UI", "TEMPLATE_BYTECODE_CACHE", True):
+            bytecode_cache = FileSystemBytecodeCache(
+                directory=str(JINJA_BYTECODE_CACHE_PATH),
+                pattern="__jinja2_%s.cache",
+            )
+
         env = RelativePathEnvironment(
             loader=final_loader,
             enable_async=True,
             autoescape=select_autoescape(["html", "xml"]),
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=bytecode_cache,
+            auto_reload=bool(Config.get_config("UI", "DEBUG_MODE", False)),
         )
         return env
 
@@ -270,14 +285,12 @@ class RendererService:
                 skin_style_path = f"{component_path_base}/skins/{variant}/style.css"
                 style_paths_to_load.append(skin_style_path)
 
+        theme_context = {"theme": context.theme_manager._theme_context_cached}
         for css_template_path in style_paths_to_load:
             try:
                 css_template = context.theme_manager.jinja_env.get_template(
                     css_template_path
                 )
-                theme_context = {
-                    "theme": context.theme_manager.jinja_env.globals.get("theme", {})
-                }
                 css_content = await css_template.render_async(**theme_context)
                 context.collected_inline_css.append(css_content)
             except TemplateNotFound:
@@ -419,18 +432,23 @@ class RendererService:
                 template = temp_env.get_template(template_path.name)
 
                 template_context = {
-                    "theme": context.theme_manager.jinja_env.globals.get("theme", {}),
+                    "theme": context.theme_manager._theme_context_cached,
                     "data": data_dict,
                 }
-                for key, value in data_dict.items():
-                    if key in RESERVED_TEMPLATE_KEYS:
-                        logger.warning(
-                            f"模板数据键 '{key}' 与渲染器保留关键字冲突，"
-                            f"在模板 '{component.template_name}' 中请使用 "
-                            f"'data.{key}' 访问。"
-                        )
-                    else:
-                        template_context[key] = value
+                for key in data_dict.keys() & RESERVED_TEMPLATE_KEYS:
+                    logger.warning(
+                        f"模板数据键 '{key}' 与渲染器保留关键字冲突，"
+                        f"在模板 '{component.template_name}' 中请使用 "
+                        f"'data.{key}' 访问。"
+                    )
+                template_context.update(
+                    {
+                        k: v
+                        for k, v in data_dict.items()
+                        if k not in RESERVED_TEMPLATE_KEYS
+                    }
+                )
+                template_context[RENDER_CONTEXT_KEY] = context
                 html_content = await template.render_async(**template_context)
 
                 component_render_options = data_dict.get("render_options", {})
@@ -587,6 +605,7 @@ class RendererService:
 
         self._theme_manager._manifest_cache.clear()
         logger.debug("已清除UI清单缓存 (manifest cache)。")
+        self._theme_manager._theme_css_cache.clear()
         current_theme_name = Config.get_config("UI", "THEME", "default")
         await self._theme_manager.load_theme(current_theme_name)
         logger.info(f"主题 '{current_theme_name}' 已成功重载。")
@@ -2,15 +2,21 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from functools import lru_cache
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+import posixpath
+import re
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from jinja2 import (
     ChoiceLoader,
+    Context,
     Environment,
     FileSystemLoader,
     PrefixLoader,
+    Template,
     TemplateNotFound,
     pass_context,
 )
@@ -19,16 +25,17 @@ from markupsafe import Markup
 from pydantic import BaseModel
 import ujson as json
 
+from zhenxun.configs.config import Config
 from zhenxun.configs.path_config import THEMES_PATH
 from zhenxun.services.log import logger
 from zhenxun.services.renderer.protocols import Renderable
 from zhenxun.services.renderer.registry import asset_registry
-from zhenxun.utils.pydantic_compat import model_dump
+from zhenxun.utils.pydantic_compat import model_construct, model_dump
 
 if TYPE_CHECKING:
     from .service import RenderContext
 
-from .config import RESERVED_TEMPLATE_KEYS
+from .config import RENDER_CONTEXT_KEY, RESERVED_TEMPLATE_KEYS
 
 
 def deep_merge_dict(base: dict, new: dict) -> dict:
@@ -45,6 +52,54 @@ def deep_merge_dict(base: dict, new: dict) -> dict:
     return result
 
 
+_SKIN_DIR_PATTERN = re.compile(r"[\\/]skins[\\/]")
+
+
+@lru_cache(maxsize=1024)
+def _list_dir(dir_path: str) -> frozenset[str]:
+    """单次 scandir 列出目录下的所有条目名，目录不存在时返回空集合。"""
+    try:
+        with os.scandir(dir_path) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+
+@lru_cache(maxsize=4096)
+def _path_exists(path: str) -> bool:
+    """
+    带缓存的路径存在性检查。
+    通过所在目录的缓存列表判断，同一目录下的多个资源只需一次 scandir。
+    """
+    dir_path, name = os.path.split(path)
+    return name in _list_dir(dir_path)
+
+
+@lru_cache(maxsize=8)
+def _load_json_file(path_str: str, mtime: float) -> dict[str, Any]:
+    """读取并解析 JSON 文件，以 (路径, mtime) 为键缓存解析结果。"""
+    return json.loads(Path(path_str).read_bytes())
+
+
+def _file_mtime(path: str | Path | None) -> float | None:
+    """获取文件的 mtime，文件不存在时返回 None。"""
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _load_json_if_exists(path: Path) -> dict[str, Any]:
+    """加载 JSON 文件，文件不存在时返回空字典。"""
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return {}
+    return _load_json_file(str(path), mtime)
+
+
 class RelativePathEnvironment(Environment):
     """
     一个自定义的 Jinja2 环境，重写了 join_path 方法以支持模板间的相对路径引用。
@@ -55,9 +110,10 @@ class RelativePathEnvironment(Environment):
         如果模板路径以 './' 或 '../' 开头，则视为相对于父模板的路径进行解析。
         否则，使用默认的解析行为。
         """
-        if template.startswith("./") or template.startswith("../"):
-            path = os.path.normpath(os.path.join(os.path.dirname(parent), template))
-            return path.replace(os.path.sep, "/")
+        if template.startswith(("./", "../")):
+            return posixpath.normpath(
+                posixpath.join(posixpath.dirname(parent), template)
+            )
         return super().join_path(template, parent)
 
 
@@ -98,58 +154,92 @@ class ResourceResolver:
         self.theme_manager = theme_manager
 
     def _find_component_root(self, start_path: Path) -> Path:
-        """从给定路径向上查找，找到包含 manifest.json 的组件根目录。"""
+        """
+        从给定路径向上查找，找到包含 manifest.json 的组件根目录。
+        结果缓存在主题管理器上，随主题加载一同清空。
+        """
+        cache = self.theme_manager._component_root_cache
+        cache_key = str(start_path)
+        if cached_root := cache.get(cache_key):
+            return cached_root
+
+        root = start_path.parent
         current_path = start_path.parent
         themes_root_parts = len(THEMES_PATH.parts)
         for _ in range(len(current_path.parts) - themes_root_parts):
-            if (current_path / "manifest.json").exists():
-                return current_path
+            if _path_exists(os.path.join(current_path, "manifest.json")):
+                root = current_path
+                break
             if current_path.parent == current_path:
                 break
             current_path = current_path.parent
-        return start_path.parent
 
-    def _search_paths_for_relative_asset(
-        self, asset_path: str, parent_template_name: str
-    ) -> list[tuple[str, Path]]:
-        """为相对路径的资源生成所有可能的查找路径元组 (描述, 路径)。"""
-        if not self.theme_manager.current_theme:
-            return []
+        cache[cache_key] = root
+        return root
 
-        paths_to_check: list[tuple[str, Path]] = []
-        current_theme_name = self.theme_manager.current_theme.name
-        current_theme_root = self.theme_manager.current_theme.assets_dir.parent
-        default_theme_root = self.theme_manager.current_theme.default_assets_dir.parent
+    def _parent_template_info(
+        self, parent_template_name: str
+    ) -> tuple[str, bool] | None:
+        """
+        获取父模板的绝对路径及其是否位于皮肤目录中。
+        结果按模板名缓存在主题管理器上，避免每次 `asset()` 调用都重新读取模板源码。
+        """
+        cache = self.theme_manager._template_abspath_cache
+        if cached := cache.get(parent_template_name):
+            return cached
 
         if not self.theme_manager.jinja_env.loader:
-            return []
+            return None
 
-        source_info = self.theme_manager.jinja_env.loader.get_source(
+        _, filename, _ = self.theme_manager.jinja_env.loader.get_source(
             self.theme_manager.jinja_env, parent_template_name
         )
-        if not source_info[1]:
+        if not filename:
+            return None
+
+        abs_path = os.path.abspath(filename)
+        info = (abs_path, _SKIN_DIR_PATTERN.search(abs_path) is not None)
+        cache[parent_template_name] = info
+        return info
+
+    def _search_paths_for_relative_asset(
+        self, asset_path: str, parent_template_name: str
+    ) -> list[tuple[str, str]]:
+        """为相对路径的资源生成所有可能的查找路径元组 (描述, 绝对路径字符串)。"""
+        if not self.theme_manager.current_theme:
             return []
 
-        parent_template_abs_path = Path(source_info[1])
+        paths_to_check: list[tuple[str, str]] = []
+        current_theme_name = self.theme_manager._current_theme_name
+        current_theme_root = self.theme_manager._theme_root_str
+        default_theme_root = self.theme_manager._default_theme_root_str
 
-        component_logical_root = Path(parent_template_name).parent
+        parent_info = self._parent_template_info(parent_template_name)
+        if not parent_info:
+            return []
+        parent_template_abs_path, is_skin = parent_info
 
-        if (
-            "/skins/" in parent_template_abs_path.as_posix()
-            or "\\skins\\" in parent_template_abs_path.as_posix()
-        ):
-            skin_dir = parent_template_abs_path.parent
+        component_logical_root = (
+            parent_template_name.rsplit("/", 1)[0]
+            if "/" in parent_template_name
+            else ""
+        )
+
+        if is_skin:
+            skin_dir = os.path.dirname(parent_template_abs_path)
             paths_to_check.append(
                 (
                     f"'{current_theme_name}' 主题皮肤资源",
-                    skin_dir / "assets" / asset_path,
+                    os.path.join(skin_dir, "assets", asset_path),
                 )
             )
 
         paths_to_check.append(
             (
                 f"'{current_theme_name}' 主题组件资源",
-                current_theme_root / component_logical_root / "assets" / asset_path,
+                os.path.join(
+                    current_theme_root, component_logical_root, "assets", asset_path
+                ),
             )
         )
 
@@ -157,7 +247,9 @@ class ResourceResolver:
             paths_to_check.append(
                 (
                     "'default' 主题组件资源 (回退)",
-                    default_theme_root / component_logical_root / "assets" / asset_path,
+                    os.path.join(
+                        default_theme_root, component_logical_root, "assets", asset_path
+                    ),
                 )
             )
         return paths_to_check
@@ -213,8 +305,13 @@ class ResourceResolver:
                 logger.warning(f"资源文件在命名空间中未找到: '{asset_path}'")
                 return ""
 
-        search_paths: list[tuple[str, Path]] = []
-        if asset_path.startswith("./") or asset_path.startswith("../"):
+        is_relative = asset_path.startswith(("./", "../"))
+        uri_cache_key = (asset_path, current_template_name if is_relative else "")
+        if cached_uri := self.theme_manager._asset_uri_cache.get(uri_cache_key):
+            return cached_uri
+
+        search_paths: list[tuple[str, str]] = []
+        if is_relative:
             relative_part = (
                 asset_path[2:] if asset_path.startswith("./") else asset_path
             )
@@ -226,23 +323,30 @@ class ResourceResolver:
         else:
             search_paths.append(
                 (
-                    f"'{self.theme_manager.current_theme.name}' 主题全局资源",
-                    self.theme_manager.current_theme.assets_dir / asset_path,
+                    f"'{self.theme_manager._current_theme_name}' 主题全局资源",
+                    os.path.join(
+                        self.theme_manager._theme_root_str, "assets", asset_path
+                    ),
                 )
             )
-            if self.theme_manager.current_theme.name != "default":
+            if self.theme_manager._current_theme_name != "default":
                 search_paths.append(
                     (
                         "'default' 主题全局资源 (回退)",
-                        self.theme_manager.current_theme.default_assets_dir
-                        / asset_path,
+                        os.path.join(
+                            self.theme_manager._default_theme_root_str,
+                            "assets",
+                            asset_path,
+                        ),
                     )
                 )
 
         for source_desc, path in search_paths:
-            if path.exists():
+            if _path_exists(path):
                 logger.debug(f"解析资源 '{asset_path}' -> 找到 {source_desc}: '{path}'")
-                return path.absolute().as_uri()
+                uri = Path(path).as_uri()
+                self.theme_manager._asset_uri_cache[uri_cache_key] = uri
+                return uri
 
         logger.warning(
             f"资源文件未找到: '{asset_path}' (在模板 '{current_template_name}' 中引用)"
@@ -251,6 +355,8 @@ class ResourceResolver:
 
 
 class ThemeManager:
+    _md_instance: ClassVar[markdown.Markdown | None] = None
+
     def __init__(self, env: Environment):
         """
         主题管理器，负责UI主题的加载、解析和模板渲染。
@@ -264,6 +370,16 @@ class ThemeManager:
         """
         self.jinja_env = env
         self.current_theme: Theme | None = None
+        self._theme_context_cached: dict[str, Any] = {}
+        self._current_theme_name: str = ""
+        self._theme_root_str: str = ""
+        self._default_theme_root_str: str = ""
+        self._theme_md_root: Path = Path()
+        self._default_md_root: Path = Path()
+        self._rendered_theme_css: str = ""
+        self._theme_css_cache: dict[str, tuple[tuple, str]] = {}
+        self._theme_css_template: Template | None = None
+        self._base_template: Template | None = None
 
         self.jinja_env.globals["render"] = self._global_render_component
         self.jinja_env.globals["asset"] = self._create_asset_loader()
@@ -273,12 +389,38 @@ class ThemeManager:
 
         self._manifest_cache: dict[str, Any] = {}
         self._manifest_cache_lock = asyncio.Lock()
+        self._themes_list_cache: tuple[float, list[str]] | None = None
+        self._resolved_not_found: set[str] = set()
+        self._template_resolution_cache: dict[tuple[str, str, str], str] = {}
+        self._component_dir_listing_cache: dict[str, frozenset[str]] = {}
+        self._template_abspath_cache: dict[str, tuple[str, bool]] = {}
+        self._asset_uri_cache: dict[tuple[str, str], str] = {}
+        self._component_root_cache: dict[str, Path] = {}
 
     def list_available_themes(self) -> list[str]:
-        """扫描主题目录并返回所有可用的主题名称。"""
-        if not THEMES_PATH.is_dir():
+        """
+        扫描主题目录并返回所有可用的主题名称。
+        结果按主题目录的 mtime 缓存，目录内容变化时自动失效。
+        """
+        try:
+            st = THEMES_PATH.stat()
+        except OSError:
+            self._themes_list_cache = None
             return []
-        return [d.name for d in THEMES_PATH.iterdir() if d.is_dir()]
+        if self._themes_list_cache and self._themes_list_cache[0] == st.st_mtime:
+            return list(self._themes_list_cache[1])
+        try:
+            with os.scandir(THEMES_PATH) as it:
+                themes = [entry.name for entry in it if entry.is_dir()]
+        except OSError:
+            return []
+        self._themes_list_cache = (st.st_mtime, themes)
+        return list(themes)
+
+    def refresh_themes(self) -> list[str]:
+        """丢弃主题列表缓存并重新扫描主题目录。"""
+        self._themes_list_cache = None
+        return self.list_available_themes()
 
     def _create_asset_loader(self) -> Callable[..., str]:
         """
@@ -308,24 +450,24 @@ class ThemeManager:
 
         return asset_loader
 
-    async def _global_render_component(self, component: Renderable | None) -> str:
+    @pass_context
+    async def _global_render_component(
+        self, ctx: Context, component: Renderable | None
+    ) -> str:
         """
         一个全局的Jinja2函数，用于在模板内部渲染子组件
         它封装了查找模板、设置上下文和渲染的逻辑。
+        会复用父模板上下文中的 `RenderContext`，使嵌套组件共享模板路径缓存。
         """
         if not component:
             return ""
         try:
-
-            class MockContext:
-                def __init__(self):
-                    self.resolved_template_paths = {}
-                    self.theme_manager = self
-
-            mock_context = MockContext()
+            render_context = ctx.get(RENDER_CONTEXT_KEY) or SimpleNamespace(
+                resolved_template_paths={}
+            )
             template_path = await self._resolve_component_template(
                 component,
-                mock_context,  # type: ignore
+                render_context,  # type: ignore
             )
             template = self.jinja_env.get_template(template_path)
 
@@ -335,6 +477,7 @@ class ThemeManager:
             }
             render_data = component.get_render_data()
             template_context.update(render_data)
+            template_context[RENDER_CONTEXT_KEY] = render_context
 
             return Markup(await template.render_async(**template_context))
         except Exception as e:
@@ -344,71 +487,138 @@ class ThemeManager:
             )
             return f"<!-- 组件渲染失败{component.__class__.__name__}: {e} -->"
 
-    @staticmethod
-    def _markdown_filter(text: str) -> str:
+    @classmethod
+    def _get_markdown(cls) -> markdown.Markdown:
+        """懒加载并复用 Markdown 实例，避免每次调用都重新构建扩展管线。"""
+        if cls._md_instance is None:
+            cls._md_instance = markdown.Markdown(
+                extensions=[
+                    "pymdownx.tasklist",
+                    "tables",
+                    "fenced_code",
+                    "codehilite",
+                    "mdx_math",
+                    "pymdownx.tilde",
+                ],
+                extension_configs={"mdx_math": {"enable_dollar_delimiter": True}},
+            )
+        return cls._md_instance
+
+    @classmethod
+    def _markdown_filter(cls, text: str) -> str:
         """一个将 Markdown 文本转换为 HTML 的 Jinja2 过滤器。"""
         if not isinstance(text, str):
             return ""
-        return markdown.markdown(
-            text,
-            extensions=[
-                "pymdownx.tasklist",
-                "tables",
-                "fenced_code",
-                "codehilite",
-                "mdx_math",
-                "pymdownx.tilde",
-            ],
-            extension_configs={"mdx_math": {"enable_dollar_delimiter": True}},
-        )
+        md = cls._get_markdown()
+        try:
+            return md.convert(text)
+        finally:
+            md.reset()
 
     async def load_theme(self, theme_name: str = "default"):
         theme_dir = THEMES_PATH / theme_name
-        if not theme_dir.is_dir():
+        if theme_name not in self.list_available_themes():
             logger.error(f"主题 '{theme_name}' 不存在，将回退到默认主题。")
             if theme_name == "default":
                 raise FileNotFoundError("默认主题 'default' 未找到！")
             theme_name = "default"
             theme_dir = THEMES_PATH / "default"
 
-        default_palette_path = THEMES_PATH / "default" / "palette.json"
-        default_palette = (
-            json.loads(default_palette_path.read_text("utf-8"))
-            if default_palette_path.exists()
-            else {}
-        )
-        if self.jinja_env.loader and isinstance(self.jinja_env.loader, ChoiceLoader):
-            current_loaders = list(self.jinja_env.loader.loaders)
-            if len(current_loaders) > 1 and isinstance(
-                current_loaders[0], PrefixLoader
-            ):
-                prefix_loader = current_loaders[0]
-                new_theme_loader = FileSystemLoader(
-                    [str(theme_dir), str(THEMES_PATH / "default")]
-                )
-                self.jinja_env.loader.loaders = [prefix_loader, new_theme_loader]
+        self._manifest_cache.clear()
+        _path_exists.cache_clear()
+        _list_dir.cache_clear()
+        self._resolved_not_found.clear()
+        self._template_resolution_cache.clear()
+        self._component_dir_listing_cache.clear()
+        self._template_abspath_cache.clear()
+        self._asset_uri_cache.clear()
+        self._component_root_cache.clear()
+
+        default_palette = _load_json_if_exists(THEMES_PATH / "default" / "palette.json")
+        loader = self.jinja_env.loader
+        if isinstance(loader, ChoiceLoader) and isinstance(
+            loader.loaders[-1], FileSystemLoader
+        ):
+            loader.loaders[-1].searchpath = [
+                str(theme_dir),
+                str(THEMES_PATH / "default"),
+            ]
+        if self.jinja_env.cache is not None:
+            self.jinja_env.cache.clear()
 
-        palette_path = theme_dir / "palette.json"
-        palette = (
-            json.loads(palette_path.read_text("utf-8")) if palette_path.exists() else {}
-        )
+        palette = _load_json_if_exists(theme_dir / "palette.json")
 
-        self.current_theme = Theme(
+        self.current_theme = model_construct(
+            Theme,
             name=theme_name,
             palette=palette,
             assets_dir=theme_dir / "assets",
             default_assets_dir=THEMES_PATH / "default" / "assets",
         )
-        theme_context_dict = {
-            "name": theme_name,
-            "palette": palette,
-            "assets_dir": theme_dir / "assets",
-            "default_assets_dir": THEMES_PATH / "default" / "assets",
-        }
-        self.jinja_env.globals["theme"] = theme_context_dict
+        self._theme_context_cached = model_dump(self.current_theme)
+        self.jinja_env.globals["theme"] = self._theme_context_cached
         self.jinja_env.globals["default_theme_palette"] = default_palette
+
+        self._current_theme_name = theme_name
+        self._theme_root_str = str(theme_dir.absolute())
+        self._default_theme_root_str = str((THEMES_PATH / "default").absolute())
+        self._theme_md_root = self.current_theme.assets_dir / "css/styles/markdown"
+        self._default_md_root = (
+            self.current_theme.default_assets_dir / "css/styles/markdown"
+        )
+        self._theme_css_template = self.jinja_env.get_template("theme.css.jinja")
+        self._base_template = self.jinja_env.get_template("partials/_base.html")
+        # 按主题名缓存，并记录调色板与样式模板的 mtime，文件变化后自动重新渲染
+        css_cache_key = (
+            _file_mtime(theme_dir / "palette.json"),
+            _file_mtime(THEMES_PATH / "default" / "palette.json"),
+            self._theme_css_template.filename,
+            _file_mtime(self._theme_css_template.filename),
+        )
+        cached_css = self._theme_css_cache.get(theme_name)
+        if cached_css and cached_css[0] == css_cache_key:
+            theme_css = cached_css[1]
+        else:
+            theme_css = await self._theme_css_template.render_async(
+                theme=self._theme_context_cached
+            )
+            self._theme_css_cache[theme_name] = (css_cache_key, theme_css)
+        self._rendered_theme_css = theme_css
         logger.info(f"主题管理器已加载主题: {theme_name}")
 
+        if Config.get_config("UI", "TEMPLATE_WARMUP", False):
+            await self._warm_up_templates(theme_dir)
+
+    async def _warm_up_templates(self, theme_dir: Path):
+        """预编译当前主题及默认主题下的所有模板，降低首次渲染延迟。"""
+
+        def _collect_names() -> set[str]:
+            names: set[str] = set()
+            for root in (theme_dir, THEMES_PATH / "default"):
+                for pattern in ("*.html", "*.jinja"):
+                    names.update(
+                        path.relative_to(root).as_posix()
+                        for path in root.rglob(pattern)
+                    )
+            return names
+
+        def _compile(name: str):
+            # 预热只是尽力而为，任何模板的语法、编码或读取错误都不应影响主题加载
+            try:
+                self.jinja_env.get_template(name)
+            except Exception as e:
+                logger.warning(f"模板预编译失败: '{name}'", e=e)
+
+        try:
+            template_names = await asyncio.to_thread(_collect_names)
+        except Exception as e:
+            logger.warning("扫描待预编译的主题模板失败，跳过预热", e=e)
+            return
+        await asyncio.gather(
+            *(asyncio.to_thread(_compile, name) for name in template_names)
+        )
+        logger.debug(f"已预编译 {len(template_names)} 个主题模板")
+
     async def _resolve_component_template(
         self, component: Renderable, context: "RenderContext"
     ) -> str:
@@ -433,7 +643,17 @@ class ThemeManager:
             logger.trace(f"模板路径缓存命中: '{cache_key}' -> '{cached_path}'")
             return cached_path
 
-        if Path(component_path_base).suffix:
+        global_key = (
+            component_path_base,
+            variant or "default",
+            self._current_theme_name,
+        )
+        if cached_path := self._template_resolution_cache.get(global_key):
+            logger.trace(f"模板路径全局缓存命中: '{cache_key}' -> '{cached_path}'")
+            context.resolved_template_paths[cache_key] = cached_path
+            return cached_path
+
+        if "." in component_path_base.rsplit("/", 1)[-1]:
             try:
                 self.jinja_env.get_template(component_path_base)
                 logger.debug(f"解析到直接模板路径: '{component_path_base}'")
@@ -470,12 +690,21 @@ class ThemeManager:
             potential_paths.append(f"{component_path_base}.html")
 
         for path in potential_paths:
+            if path in self._resolved_not_found:
+                continue
+            rel_dir, _, filename = path.rpartition("/")
+            listing = self._list_component_dir(rel_dir)
+            if listing is not None and filename not in listing:
+                self._resolved_not_found.add(path)
+                continue
             try:
                 self.jinja_env.get_template(path)
                 logger.debug(f"解析到模板路径: '{path}'")
                 context.resolved_template_paths[cache_key] = path
+                self._template_resolution_cache[global_key] = path
                 return path
             except TemplateNotFound:
+                self._resolved_not_found.add(path)
                 continue
 
         err_msg = (
@@ -485,18 +714,95 @@ class ThemeManager:
         logger.error(err_msg)
         raise TemplateNotFound(err_msg)
 
+    def _theme_file_loader(self, template_name: str) -> FileSystemLoader | None:
+        """
+        如果模板名由主题目录的 `FileSystemLoader` 提供，则返回该加载器；
+        对于命名空间模板或非预期的加载器结构返回 None。
+        """
+        loader = self.jinja_env.loader
+        if not isinstance(loader, ChoiceLoader) or not isinstance(
+            loader.loaders[-1], FileSystemLoader
+        ):
+            return None
+        prefix_loader = loader.loaders[0]
+        if isinstance(prefix_loader, PrefixLoader):
+            namespace = template_name.split(prefix_loader.delimiter, 1)[0]
+            if namespace in prefix_loader.mapping:
+                return None
+        return loader.loaders[-1]
+
+    def _read_manifest_source(self, manifest_path_str: str) -> tuple[str, str]:
+        """
+        读取清单文件源码，返回 (源码, 文件路径)。
+
+        对于主题目录中的清单，直接尝试打开文件并捕获 `FileNotFoundError`，
+        避免 `FileSystemLoader.get_source` 先 stat 再 open 的多次系统调用；
+        命名空间清单仍交由加载器处理。
+        """
+        theme_loader = self._theme_file_loader(manifest_path_str)
+        if theme_loader is None:
+            assert self.jinja_env.loader is not None
+            source, filepath, _ = self.jinja_env.loader.get_source(
+                self.jinja_env, manifest_path_str
+            )
+            return source, filepath or manifest_path_str
+
+        for search_path in theme_loader.searchpath:
+            filepath = os.path.join(search_path, manifest_path_str)
+            try:
+                with open(filepath, encoding=theme_loader.encoding) as f:
+                    return f.read(), filepath
+            except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+                continue
+        raise TemplateNotFound(manifest_path_str)
+
+    def _list_component_dir(self, rel_dir: str) -> frozenset[str] | None:
+        """
+        列出主题目录(含默认主题回退)中某个相对目录下的所有文件名，结果会被缓存。
+        对于不由主题目录提供的模板(如命名空间模板)返回 None。
+        """
+        if (cached := self._component_dir_listing_cache.get(rel_dir)) is not None:
+            return cached
+
+        theme_loader = self._theme_file_loader(rel_dir)
+        if theme_loader is None:
+            return None
+
+        names: set[str] = set()
+        for search_path in theme_loader.searchpath:
+            try:
+                with os.scandir(os.path.join(search_path, rel_dir)) as it:
+                    names.update(entry.name for entry in it)
+            except OSError:
+                continue
+
+        listing = frozenset(names)
+        self._component_dir_listing_cache[rel_dir] = listing
+        return listing
+
     async def _load_single_manifest(self, path_str: str) -> dict[str, Any] | None:
-        """从指定路径加载单个 manifest.json 文件。"""
+        """
+        从指定路径加载单个 manifest.json 文件。
+        解析结果(包括未找到)以清单文件路径为键存入 `_manifest_cache`，
+        与合并后的清单共用同一个缓存。
+        """
         normalized_path = path_str.replace("\\", "/")
         manifest_path_str = f"{normalized_path}/manifest.json"
 
+        if manifest_path_str in self._manifest_cache:
+            return self._manifest_cache[manifest_path_str]
+
+        manifest = self._parse_single_manifest(manifest_path_str)
+        self._manifest_cache[manifest_path_str] = manifest
+        return manifest
+
+    def _parse_single_manifest(self, manifest_path_str: str) -> dict[str, Any] | None:
+        """读取并解析单个 manifest.json 文件。"""
         if not self.jinja_env.loader:
             return None
 
         try:
-            source, filepath, _ = self.jinja_env.loader.get_source(
-                self.jinja_env, manifest_path_str
-            )
+            source, filepath = self._read_manifest_source(manifest_path_str)
             logger.debug(f"找到清单文件: '{manifest_path_str}' (从 '{filepath}' 加载)")
             return json.loads(source)
         except TemplateNotFound:
@@ -585,28 +891,18 @@ class ThemeManager:
             resolved_path = registered_path
 
         elif self.current_theme:
-            theme_style_path = (
-                self.current_theme.assets_dir
-                / "css"
-                / "styles"
-                / "markdown"
-                / f"{style_name}.css"
-            )
-            if theme_style_path.exists():
+            style_filename = f"{style_name}.css"
+            if _path_exists(
+                str(theme_style_path := self._theme_md_root / style_filename)
+            ):
                 logger.debug(
                     f"在主题 '{self.current_theme.name}' 中找到"
                     f"Markdown 样式: '{style_name}'"
                 )
                 resolved_path = theme_style_path
-
-            default_style_path = (
-                self.current_theme.default_assets_dir
-                / "css"
-                / "styles"
-                / "markdown"
-                / f"{style_name}.css"
-            )
-            if not resolved_path and default_style_path.exists():
+            elif _path_exists(
+                str(default_style_path := self._default_md_root / style_filename)
+            ):
                 logger.debug(f"在 'default' 主题中找到 Markdown 样式: '{style_name}'")
                 resolved_path = default_style_path
 
@@ -630,12 +926,7 @@ class ThemeManager:
 
         data_dict = component.get_render_data()
 
-        theme_context_dict = model_dump(self.current_theme)
-
-        theme_css_template = self.jinja_env.get_template("theme.css.jinja")
-        theme_css_content = await theme_css_template.render_async(
-            theme=theme_context_dict
-        )
+        theme_css_content = self._rendered_theme_css
 
         resolved_template_name = await self._resolve_component_template(
             component, context
@@ -647,28 +938,29 @@ class ThemeManager:
         )
         template = self.jinja_env.get_template(resolved_template_name)
 
-        unpacked_data = {}
-        for key, value in data_dict.items():
-            if key in RESERVED_TEMPLATE_KEYS:
-                logger.warning(
-                    f"模板数据键 '{key}' 与渲染器保留关键字冲突，"
-                    f"在模板 '{component.template_name}' 中请使用 'data.{key}' 访问。"
-                )
-            else:
-                unpacked_data[key] = value
+        for key in data_dict.keys() & RESERVED_TEMPLATE_KEYS:
+            logger.warning(
+                f"模板数据键 '{key}' 与渲染器保留关键字冲突，"
+                f"在模板 '{component.template_name}' 中请使用 'data.{key}' 访问。"
+            )
+        unpacked_data = {
+            k: v for k, v in data_dict.items() if k not in RESERVED_TEMPLATE_KEYS
+        }
 
         template_context = {
             "data": component,
-            "theme": theme_context_dict,
             "frameless": kwargs.get("frameless", False),
         }
         template_context.update(unpacked_data)
         template_context.update(kwargs)
+        template_context[RENDER_CONTEXT_KEY] = context
 
         html_fragment = await template.render_async(**template_context)
 
         if not kwargs.get("frameless", False):
-            base_template = self.jinja_env.get_template("partials/_base.html")
+            base_template = self._base_template or self.jinja_env.get_template(
+                "partials/_base.html"
+            )
             page_context = {
                 "data": component,
                 "theme_css": theme_css_content,
@@ -8,30 +8,117 @@
 import asyncio
 from collections.abc import Callable
 from datetime import datetime
-from functools import partial
+from functools import cache, partial
 import random
+import time
+from typing import TYPE_CHECKING, Any
 
+from apscheduler.job import Job
+from apscheduler.util import asbool, asint
 import nonebot
 from nonebot.adapters import Bot
-from nonebot.dependencies import Dependent
 from nonebot.exception import FinishedException, PausedException, SkippedException
-from nonebot.matcher import Matcher
-from nonebot.typing import T_State
+from nonebot.utils import is_coroutine_callable
+from nonebot_plugin_apscheduler import plugin_config as aps_plugin_config
 from nonebot_plugin_apscheduler import scheduler
 from pydantic import BaseModel
+from tortoise.expressions import F
 
 from zhenxun.configs.config import Config
 from zhenxun.models.scheduled_job import ScheduledJob
 from zhenxun.services.log import logger
 from zhenxun.utils.common_utils import CommonUtils
 from zhenxun.utils.decorator.retry import Retry
-from zhenxun.utils.pydantic_compat import parse_as
+from zhenxun.utils.pydantic_compat import model_construct, model_copy, parse_as
 
 from .repository import ScheduleRepository
 from .types import ExecutionPolicy, ScheduleContext
 
+if TYPE_CHECKING:
+    from .manager import SchedulerManager
+
 JOB_PREFIX = "zhenxun_schedule_"
 SCHEDULE_CONCURRENCY_KEY = "all_groups_concurrency_limit"
+_CANONICAL_TARGETS = frozenset({"GROUP", "TAG", "ALL_GROUPS", "GLOBAL", "USER"})
+"""内置目标类型的规范(大写)形式，命中时无需再做 upper() 转换"""
+
+_POLICY_JOB_PARAMS: dict[str, dict[str, Any]] = {
+    # ALLOW 沿用调度器配置的 job_defaults，原地更新时由 _allow_reset_params 补齐
+    "ALLOW": {"misfire_grace_time": 300},
+    "SKIP": {"misfire_grace_time": 300, "max_instances": 1, "coalesce": True},
+    "QUEUE": {"misfire_grace_time": 300, "max_instances": 1, "coalesce": False},
+}
+"""各并发策略对应的 APScheduler Job 参数"""
+
+_JOB_ID_CACHE: dict[int, str] = {}
+"""schedule_id -> APScheduler Job ID 的缓存"""
+
+_pending_loads: dict[int, asyncio.Future[ScheduledJob | None]] = {}
+"""等待合并加载的任务ID -> 结果 Future"""
+_load_batch_tasks: set[asyncio.Task] = set()
+
+
+class _AdmissionController:
+    """
+    上限可在运行中调整的并发准入控制器
+
+    与 `asyncio.Semaphore` 不同，调整上限会立即作用于正在等待的目标，
+    无需重建控制器。
+    """
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    async def set_limit(self, limit: int):
+        """调整并发上限，上调时唤醒等待中的目标"""
+        if limit == self._limit:
+            return
+        async with self._condition:
+            self._limit = limit
+            self._condition.notify_all()
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def __aexit__(self, *exc_info):
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify(1)
+
+
+_admission_controllers: dict[int, _AdmissionController] = {}
+"""schedule_id -> 准入控制器，在多次触发之间复用"""
+
+_policy_cache: dict[int, tuple[dict, ExecutionPolicy, dict]] = {}
+"""schedule_id -> (原始参数, 执行策略, 移除执行策略后的参数)"""
+
+_retry_executor_cache: dict[int, tuple[ExecutionPolicy, Callable]] = {}
+"""schedule_id -> (执行策略, 重试执行器)"""
+
+_params_cache: dict[int, tuple[type[BaseModel], dict, BaseModel]] = {}
+"""schedule_id -> (参数模型, 原始参数, 验证后的参数实例)"""
+
+_pending_resumes: set[int] = set()
+"""恢复时已不在调度器中、等待重新添加的任务ID"""
+_resume_worker_task: asyncio.Task | None = None
+
+_RUN_STATUS_FIELDS = ["last_run_at", "last_run_status", "consecutive_failures"]
+_RUN_STATUS_FLUSH_DELAY = 0.5
+"""成功状态回写的合并窗口（秒）"""
+_pending_status_updates: dict[int, ScheduledJob] = {}
+"""schedule_id -> 等待合并写回的成功状态"""
+_status_flush_task: asyncio.Task | None = None
+_status_write_lock = asyncio.Lock()
+"""保证批量写回与失败状态写入按发生顺序落库"""
+
+_BLOCK_CACHE_TTL = 10.0
+"""被动技能禁用状态的缓存时长（秒）"""
+_BLOCK_CACHE_MAX_SIZE = 1024
+_block_cache: dict[tuple[str, str, str | None], tuple[float, bool]] = {}
 
 
 class APSchedulerAdapter:
@@ -48,7 +135,9 @@ class APSchedulerAdapter:
         返回:
             str: APScheduler 使用的 Job ID。
         """
-        return f"{JOB_PREFIX}{schedule_id}"
+        if job_id := _JOB_ID_CACHE.get(schedule_id):
+            return job_id
+        return _JOB_ID_CACHE.setdefault(schedule_id, f"{JOB_PREFIX}{schedule_id}")
 
     @staticmethod
     def add_or_reschedule_job(schedule: ScheduledJob):
@@ -59,13 +148,11 @@ class APSchedulerAdapter:
             schedule: 定时任务对象，包含任务的所有配置信息。
         """
         job_id = APSchedulerAdapter._get_job_id(schedule.id)
-
-        try:
-            scheduler.remove_job(job_id)
-        except Exception:
-            pass
+        existing_job = scheduler.get_job(job_id)
 
         if not isinstance(schedule.trigger_config, dict):
+            if existing_job:
+                existing_job.remove()
             logger.error(
                 f"任务 {schedule.id} 的 trigger_config 不是字典类型: "
                 f"{type(schedule.trigger_config)}"
@@ -84,24 +171,24 @@ class APSchedulerAdapter:
 
         concurrency_policy = execution_options.get("concurrency_policy", "ALLOW")
         job_params = {
-            "id": job_id,
-            "misfire_grace_time": 300,
+            **_POLICY_JOB_PARAMS.get(concurrency_policy, _POLICY_JOB_PARAMS["ALLOW"]),
             "args": [schedule.id],
         }
 
-        if concurrency_policy == "SKIP":
-            job_params["max_instances"] = 1
-            job_params["coalesce"] = True
-        elif concurrency_policy == "QUEUE":
-            job_params["max_instances"] = 1
-            job_params["coalesce"] = False
-
-        scheduler.add_job(
-            _execute_job,
-            trigger=schedule.trigger_type,
-            **job_params,
-            **trigger_params,
-        )
+        if existing_job:
+            if "max_instances" not in job_params:
+                # 原地更新时需显式回到调度器默认值，以撤销之前策略的设置
+                job_params.update(_allow_reset_params())
+            existing_job.modify(**job_params)
+            existing_job.reschedule(trigger=schedule.trigger_type, **trigger_params)
+        else:
+            scheduler.add_job(
+                _execute_job,
+                trigger=schedule.trigger_type,
+                id=job_id,
+                **job_params,
+                **trigger_params,
+            )
         logger.debug(
             f"已添加或更新APScheduler任务: {job_id} | 并发策略: {concurrency_policy}, "
             f"抖动: {trigger_params.get('jitter', '无')}"
@@ -121,6 +208,12 @@ class APSchedulerAdapter:
             logger.debug(f"已从APScheduler中移除任务: {job_id}")
         except Exception:
             pass
+        finally:
+            _JOB_ID_CACHE.pop(schedule_id, None)
+            _admission_controllers.pop(schedule_id, None)
+            _policy_cache.pop(schedule_id, None)
+            _params_cache.pop(schedule_id, None)
+            _retry_executor_cache.pop(schedule_id, None)
 
     @staticmethod
     def pause_job(schedule_id: int):
@@ -148,14 +241,10 @@ class APSchedulerAdapter:
         try:
             scheduler.resume_job(job_id)
         except Exception:
-            import asyncio
-
-            async def _re_add_job():
-                schedule = await ScheduleRepository.get_by_id(schedule_id)
-                if schedule:
-                    APSchedulerAdapter.add_or_reschedule_job(schedule)
-
-            asyncio.create_task(_re_add_job())  # noqa: RUF006
+            global _resume_worker_task
+            _pending_resumes.add(schedule_id)
+            if _resume_worker_task is None or _resume_worker_task.done():
+                _resume_worker_task = asyncio.create_task(_re_add_pending_jobs())
 
     @staticmethod
     def get_job_status(schedule_id: int) -> dict:
@@ -169,7 +258,35 @@ class APSchedulerAdapter:
             dict: 包含任务状态信息的字典，包含next_run_time等字段。
         """
         job_id = APSchedulerAdapter._get_job_id(schedule_id)
-        job = scheduler.get_job(job_id)
+        return APSchedulerAdapter._format_job_status(scheduler.get_job(job_id))
+
+    @staticmethod
+    def get_job_statuses(schedule_ids: list[int]) -> dict[int, dict]:
+        """
+        批量获取多个 APScheduler Job 的状态
+
+        只调用一次 `scheduler.get_jobs()` 并在本地建立索引，
+        避免逐个任务调用 `get_job` 造成的重复查找。
+
+        参数:
+            schedule_ids: 定时任务ID列表。
+
+        返回:
+            dict[int, dict]: 以任务ID为键的状态字典。
+        """
+        if not schedule_ids:
+            return {}
+        jobs_by_id = {job.id: job for job in scheduler.get_jobs()}
+        return {
+            schedule_id: APSchedulerAdapter._format_job_status(
+                jobs_by_id.get(APSchedulerAdapter._get_job_id(schedule_id))
+            )
+            for schedule_id in schedule_ids
+        }
+
+    @staticmethod
+    def _format_job_status(job: Job | None) -> dict:
+        """将 APScheduler Job 转换为状态字典"""
         return {
             "next_run_time": job.next_run_time.strftime("%Y-%m-%d %H:%M:%S")
             if job and job.next_run_time
@@ -212,25 +329,403 @@ class APSchedulerAdapter:
         logger.debug(f"已添加新的临时APScheduler任务: {job_id}")
 
 
+async def _re_add_pending_jobs():
+    """
+    批量重新添加恢复失败的任务
+
+    短时间内大量恢复操作（如“恢复全部”）会被合并，
+    每一轮只进行一次批量查询。
+    """
+    while _pending_resumes:
+        schedule_ids = list(_pending_resumes)
+        _pending_resumes.clear()
+        try:
+            schedules = await ScheduleRepository.get_by_ids(schedule_ids)
+        except Exception as e:
+            logger.error(f"重新添加任务 {schedule_ids} 时查询失败", e=e)
+            continue
+        for schedule in schedules.values():
+            APSchedulerAdapter.add_or_reschedule_job(schedule)
+
+
+def _queue_run_status_update(schedule: ScheduledJob):
+    """
+    登记任务的成功执行状态，等待合并写回数据库
+
+    成功状态均为绝对值（计数清零），合并窗口内多次成功只需写入最后一次；
+    失败计数依赖数据库中的当前值，由 `_record_run_failure` 立即写入。
+
+    参数:
+        schedule: 已更新 last_run_* 字段的任务对象。
+    """
+    global _status_flush_task
+    _pending_status_updates[schedule.id] = schedule
+    if _status_flush_task is None or _status_flush_task.done():
+        _status_flush_task = asyncio.create_task(_delayed_flush_run_status())
+
+
+def _apply_pending_run_status(schedule: ScheduledJob):
+    """将尚未写回的成功状态覆盖到刚从数据库加载的任务对象上"""
+    if pending := _pending_status_updates.get(schedule.id):
+        for field in _RUN_STATUS_FIELDS:
+            setattr(schedule, field, getattr(pending, field))
+
+
+async def _record_run_failure(schedule: ScheduledJob):
+    """
+    立即写入任务的失败状态
+
+    连续失败次数通过数据库端自增更新，避免并发触发时基于旧值计算而丢失计数；
+    若该任务还有未写回的成功状态，说明成功发生在本次失败之前，计数应从 1 开始。
+
+    参数:
+        schedule: 执行失败的任务对象。
+    """
+    async with _status_write_lock:
+        pending_success = _pending_status_updates.pop(schedule.id, None)
+        failures = 1 if pending_success else F("consecutive_failures") + 1
+        await ScheduledJob.filter(id=schedule.id).update(
+            last_run_at=schedule.last_run_at,
+            last_run_status="FAILURE",
+            consecutive_failures=failures,
+        )
+
+
+async def _delayed_flush_run_status():
+    """等待合并窗口结束后写回执行状态"""
+    await asyncio.sleep(_RUN_STATUS_FLUSH_DELAY)
+    await flush_run_status_updates()
+
+
+async def flush_run_status_updates():
+    """
+    将所有待写回的成功状态通过 bulk_update 一次性写入数据库
+
+    写入失败时任务会重新放回队列（不覆盖期间新登记的状态），
+    在下一次合并窗口或关闭时重试。
+    """
+    async with _status_write_lock:
+        while _pending_status_updates:
+            schedules = list(_pending_status_updates.values())
+            _pending_status_updates.clear()
+            try:
+                await ScheduledJob.bulk_update(
+                    schedules, fields=_RUN_STATUS_FIELDS, batch_size=200
+                )
+            except Exception as e:
+                logger.error(
+                    f"批量写回 {len(schedules)} 个定时任务的执行状态失败，"
+                    f"将在下次写回时重试",
+                    e=e,
+                )
+                for schedule in schedules:
+                    _pending_status_updates.setdefault(schedule.id, schedule)
+                break
+
+
+async def _get_admission_controller(
+    schedule_id: int, limit: int
+) -> _AdmissionController:
+    """
+    获取任务分发目标时使用的准入控制器
+
+    同一任务的控制器在多次触发之间复用，并发上限配置变化时原地更新，
+    同一任务仍在进行中的分发也会立即按新上限执行。
+
+    参数:
+        schedule_id: 定时任务ID。
+        limit: 并发上限。
+
+    返回:
+        _AdmissionController: 对应的准入控制器。
+    """
+    if controller := _admission_controllers.get(schedule_id):
+        await controller.set_limit(limit)
+        return controller
+    controller = _admission_controllers[schedule_id] = _AdmissionController(limit)
+    return controller
+
+
+async def _load_batch(batch: dict[int, asyncio.Future[ScheduledJob | None]]):
+    """执行一次批量查询，并将结果分发给各个等待中的 Future"""
+    try:
+        schedules = await ScheduleRepository.get_by_ids(list(batch))
+    except Exception as e:
+        for pending in batch.values():
+            if not pending.done():
+                pending.set_exception(e)
+    else:
+        for pending_id, pending in batch.items():
+            if not pending.done():
+                pending.set_result(schedules.get(pending_id))
+
+
+async def _load_schedule(schedule_id: int) -> ScheduledJob | None:
+    """
+    合并同一轮事件循环内的任务加载请求，使用一次批量查询获取
+
+    APScheduler 会在同一轮循环中创建所有到期任务，第一个请求只让出一次
+    事件循环即可收集到同批请求，单个任务触发时不会引入额外延迟。
+    批量查询在独立的任务中执行，发起请求的任务被取消时不会影响其他等待者。
+
+    参数:
+        schedule_id: 定时任务ID。
+
+    返回:
+        ScheduledJob | None: 任务对象，不存在时返回None。
+    """
+    if schedule_id in _pending_loads:
+        # 同一任务在同一批次内被重复触发时单独加载，避免共享同一个模型实例
+        return await ScheduleRepository.get_by_id(schedule_id)
+
+    loop = asyncio.get_running_loop()
+    is_leader = not _pending_loads
+    future = _pending_loads[schedule_id] = loop.create_future()
+    if is_leader:
+        try:
+            await asyncio.sleep(0)
+        finally:
+            batch = dict(_pending_loads)
+            _pending_loads.clear()
+            task = asyncio.create_task(_load_batch(batch))
+            _load_batch_tasks.add(task)
+            task.add_done_callback(_load_batch_tasks.discard)
+    return await future
+
+
+@cache
+def _allow_reset_params() -> dict[str, Any]:
+    """
+    ALLOW 策略原地更新任务时需要恢复的 Job 参数
+
+    取值来自 nonebot_plugin_apscheduler 的 `apscheduler_config` 配置，
+    解析方式与 `scheduler.configure` 相同(前缀 `apscheduler.`，点号分隔)，
+    未配置时回退到 APScheduler 自身的默认值。
+    """
+    job_defaults: dict[str, Any] = {}
+    for key, value in aps_plugin_config.apscheduler_config.items():
+        if key == "apscheduler.job_defaults" and isinstance(value, dict):
+            job_defaults.update(value)
+        elif key.startswith("apscheduler.job_defaults."):
+            job_defaults[key.removeprefix("apscheduler.job_defaults.")] = value
+    return {
+        "max_instances": asint(job_defaults.get("max_instances", 1)),
+        "coalesce": asbool(job_defaults.get("coalesce", True)),
+    }
+
+
+@cache
+def _get_scheduler_manager() -> "SchedulerManager":
+    """
+    获取 `scheduler_manager` 单例
+
+    manager 模块在导入时依赖本模块，因此只能延迟导入；
+    结果被缓存，避免每次触发都执行一次 import 语句。
+    """
+    from .manager import scheduler_manager
+
+    return scheduler_manager
+
+
+async def _is_task_blocked(
+    bot: Bot, plugin_name: str, group_id: str | None = None
+) -> bool:
+    """
+    带短时缓存的 `CommonUtils.task_is_block`
+
+    同一次调度中大量目标会重复查询相同插件的禁用状态，
+    在 TTL 内直接复用上一次的结果。
+
+    参数:
+        bot: Bot 实例。
+        plugin_name: 插件（被动技能）模块名。
+        group_id: 群组ID，为None时仅检查全局与Bot级别的状态。
+
+    返回:
+        bool: 是否被禁用。
+    """
+    key = (bot.self_id, plugin_name, group_id)
+    now = time.monotonic()
+    if (cached := _block_cache.get(key)) and cached[0] > now:
+        return cached[1]
+    is_blocked = await CommonUtils.task_is_block(bot, plugin_name, group_id)
+    if len(_block_cache) >= _BLOCK_CACHE_MAX_SIZE:
+        _block_cache.clear()
+    _block_cache[key] = (now + _BLOCK_CACHE_TTL, is_blocked)
+    return is_blocked
+
+
+async def _filter_blocked_targets(
+    bot: Bot,
+    schedule: ScheduledJob,
+    resolved_targets: list[str | None],
+    group_targets: list[str],
+) -> list[str | None]:
+    """
+    一次性批量检查所有群组目标的禁用状态，并移除被禁用的目标
+
+    检查结果会写入禁用状态缓存，后续逐目标的检查可直接命中。
+
+    参数:
+        bot: Bot 实例。
+        schedule: 定时任务对象。
+        resolved_targets: 解析出的全部目标。
+        group_targets: 其中的群组目标。
+
+    返回:
+        list[str | None]: 未被禁用的目标。
+    """
+    plugin_name = schedule.plugin_name
+    blocked = await CommonUtils.task_is_block_bulk(bot, plugin_name, group_targets)
+    expire_at = time.monotonic() + _BLOCK_CACHE_TTL
+    if len(_block_cache) + len(group_targets) > _BLOCK_CACHE_MAX_SIZE:
+        _block_cache.clear()
+    for group_id in group_targets:
+        _block_cache[(bot.self_id, plugin_name, group_id)] = (
+            expire_at,
+            group_id in blocked,
+        )
+    if not blocked:
+        return resolved_targets
+    logger.info(
+        f"插件 '{plugin_name}' 的定时任务 (ID: {schedule.id}) 在 "
+        f"{len(blocked)} 个群组因功能被禁用而跳过执行。"
+    )
+    return [t for t in resolved_targets if t not in blocked]
+
+
+def _split_execution_policy(schedule: ScheduledJob) -> tuple[ExecutionPolicy, dict]:
+    """
+    从任务参数中分离出执行策略
+
+    结果按任务ID缓存，原始 job_kwargs 未变化时直接复用，
+    避免每次触发都复制参数并重新构建 `ExecutionPolicy`。
+
+    参数:
+        schedule: 定时任务对象。
+
+    返回:
+        tuple[ExecutionPolicy, dict]: 执行策略与移除 execution_policy 后的参数。
+    """
+    raw_kwargs = schedule.job_kwargs if isinstance(schedule.job_kwargs, dict) else {}
+    cached = _policy_cache.get(schedule.id)
+    if cached and cached[0] == raw_kwargs:
+        return cached[1], cached[2]
+    job_kwargs = dict(raw_kwargs)
+    policy = ExecutionPolicy(**job_kwargs.pop("execution_policy", {}))
+    _policy_cache[schedule.id] = (raw_kwargs, policy, job_kwargs)
+    return policy, job_kwargs
+
+
+def _validate_job_params(
+    schedule: ScheduledJob, task_meta: dict, job_kwargs: dict
+) -> BaseModel | None:
+    """
+    按任务注册的参数模型验证 job_kwargs
+
+    参数:
+        schedule: 定时任务对象。
+        task_meta: 注册的任务元数据。
+        job_kwargs: 已移除 execution_policy 的任务参数。
+
+    返回:
+        BaseModel | None: 参数模型实例，任务未声明参数模型时返回None。
+            该实例会在多次触发间复用，执行前需由调用方复制。
+    """
+    params_model = task_meta.get("model")
+    if not (isinstance(params_model, type) and issubclass(params_model, BaseModel)):
+        return None
+    # 任务参数通常在多次触发之间保持不变，参数未变化时直接复用上次的验证结果
+    cached = _params_cache.get(schedule.id)
+    if cached and cached[0] is params_model and cached[1] == job_kwargs:
+        return cached[2]
+    try:
+        params = parse_as(params_model, job_kwargs)
+    except Exception as e:
+        logger.error(f"任务 {schedule.id} 参数验证失败: {e}", e=e)
+        raise
+    _params_cache[schedule.id] = (params_model, job_kwargs, params)
+    return params
+
+
+async def _call_task(func: Callable, bot: Bot, injected_params: dict) -> Any:
+    """
+    以给定的 bot 与注入参数执行任务函数
+
+    重试执行器在所有目标间共用，失败时在此记录目标，以便区分不同目标的重试日志。
+    """
+    try:
+        return await func(bot=bot, **injected_params)
+    except (PausedException, FinishedException, SkippedException):
+        raise
+    except Exception as e:
+        context: ScheduleContext = injected_params["context"]
+        logger.warning(
+            f"定时任务 {context.schedule_id} 在目标 [{context.group_id or '全局'}] "
+            f"执行失败: {type(e).__name__}({e})"
+        )
+        raise
+
+
+def _get_retry_executor(schedule_id: int, policy: ExecutionPolicy) -> Callable:
+    """
+    获取带重试策略的执行器
+
+    重试配置只与执行策略有关，执行器按任务ID缓存并在所有目标间共用；
+    `policy` 由 `_split_execution_policy` 缓存，参数变化时会是新的对象，
+    因此以对象身份判断是否需要重建。
+
+    参数:
+        schedule_id: 定时任务ID。
+        policy: 执行策略。
+
+    返回:
+        Callable: 以 `(func, bot, injected_params)` 调用的重试执行器。
+    """
+    cached = _retry_executor_cache.get(schedule_id)
+    if cached and cached[0] is policy:
+        return cached[1]
+    executor = Retry.api(
+        stop_max_attempt=policy.retries + 1,
+        strategy="exponential" if policy.retry_backoff else "fixed",
+        wait_fixed_seconds=policy.retry_delay_seconds,
+        exception=tuple(policy.retry_on_exceptions or []),
+        log_name=f"ScheduledJob-{schedule_id}",
+    )(_call_task)
+    _retry_executor_cache[schedule_id] = (policy, executor)
+    return executor
+
+
+async def _call_policy_callback(callback: Callable, *args: Any):
+    """调用执行策略中的回调，兼容同步与异步函数"""
+    if is_coroutine_callable(callback):
+        await callback(*args)
+    else:
+        callback(*args)
+
+
 async def _execute_single_job_instance(
-    schedule: ScheduledJob, bot, group_id: str | None = None
+    schedule: ScheduledJob,
+    bot,
+    group_id: str | None = None,
+    *,
+    func: Callable,
+    params: BaseModel | None,
+    policy: ExecutionPolicy,
+    job_kwargs: dict,
+    log_start: bool = True,
 ):
     """
     负责执行一个具体目标的任务实例。
-    """
-    from .manager import scheduler_manager
 
+    执行策略与参数校验已在 `_execute_job` 中针对整次调度完成，
+    这里仅处理目标级别的禁用检查、上下文构建与重试策略。
+    """
     plugin_name = schedule.plugin_name
     if group_id is None and schedule.target_type == "GROUP":
         group_id = schedule.target_identifier
 
-    task_meta = scheduler_manager._registered_tasks.get(plugin_name)
-
-    if not task_meta:
-        logger.error(f"无法执行任务：插件 '{plugin_name}' 在执行期间变得不可用。")
-        return
-
-    is_blocked = await CommonUtils.task_is_block(bot, plugin_name, group_id)
+    is_blocked = await _is_task_blocked(bot, plugin_name, group_id)
     if is_blocked:
         target_desc = f"群 {group_id}" if group_id else "全局"
         logger.info(
@@ -239,74 +734,35 @@ async def _execute_single_job_instance(
         )
         return
 
-    context = ScheduleContext(
+    # 字段均来自已校验的数据，跳过 pydantic 验证直接构建上下文
+    context = model_construct(
+        ScheduleContext,
         schedule_id=schedule.id,
         plugin_name=plugin_name,
         bot_id=bot.self_id,
         group_id=group_id,
-        job_kwargs=schedule.job_kwargs if isinstance(schedule.job_kwargs, dict) else {},
+        job_kwargs=dict(job_kwargs),
     )
-    state: T_State = {ScheduleContext: context}
-
-    policy_data = context.job_kwargs.pop("execution_policy", {})
-    policy = ExecutionPolicy(**policy_data)
-
-    async def task_execution_coro():
-        injected_params = {"context": context}
-
-        params_model = task_meta.get("model")
-        if params_model and isinstance(context.job_kwargs, dict):
-            try:
-                if isinstance(params_model, type) and issubclass(
-                    params_model, BaseModel
-                ):
-                    params_instance = parse_as(params_model, context.job_kwargs)
-                    injected_params["params"] = params_instance  # type: ignore
-            except Exception as e:
-                logger.error(
-                    f"任务 {schedule.id} (目标: {group_id}) 参数验证失败: {e}", e=e
-                )
-                raise
-
-        async def wrapper(bot: Bot):
-            return await task_meta["func"](bot=bot, **injected_params)  # type: ignore
-
-        dependent = Dependent.parse(
-            call=wrapper,
-            allow_types=Matcher.HANDLER_PARAM_TYPES,
-        )
-        return await dependent(bot=bot, state=state)
+    injected_params: dict[str, Any] = {"context": context}
+    if params is not None:
+        # 验证结果在多次触发与多个目标间共享，每个目标注入独立副本，
+        # 避免任务修改参数后影响其他目标或下一次触发
+        injected_params["params"] = model_copy(params, deep=True)
 
     try:
         if policy.retries > 0:
-            on_success_handler = None
+            executor = _get_retry_executor(schedule.id, policy)
+            # 重试耗尽后异常直接向上抛出，由下方统一记录错误日志
+            result = await executor(func, bot, injected_params)
             if policy.on_success_callback:
-                on_success_handler = partial(policy.on_success_callback, context)
-
-            on_failure_handler = None
-            if policy.on_failure_callback:
-                on_failure_handler = partial(policy.on_failure_callback, context)
-
-            retry_exceptions = tuple(policy.retry_on_exceptions or [])
-
-            retry_decorator = Retry.api(
-                stop_max_attempt=policy.retries + 1,
-                strategy="exponential" if policy.retry_backoff else "fixed",
-                wait_fixed_seconds=policy.retry_delay_seconds,
-                exception=retry_exceptions,
-                on_success=on_success_handler,
-                on_failure=on_failure_handler,
-                log_name=f"ScheduledJob-{schedule.id}-{group_id or 'global'}",
-            )
-
-            decorated_executor = retry_decorator(task_execution_coro)
-            await decorated_executor()
+                await _call_policy_callback(policy.on_success_callback, context, result)
         else:
-            logger.info(
-                f"插件 '{plugin_name}' 开始为目标 [{group_id or '全局'}] "
-                f"执行定时任务 (ID: {schedule.id})。"
-            )
-            await task_execution_coro()
+            if log_start:
+                logger.info(
+                    f"插件 '{plugin_name}' 开始为目标 [{group_id or '全局'}] "
+                    f"执行定时任务 (ID: {schedule.id})。"
+                )
+            await func(bot=bot, **injected_params)
 
     except (PausedException, FinishedException, SkippedException) as e:
         logger.warning(
@@ -328,7 +784,7 @@ async def _execute_job(
     """
     APScheduler 调度的入口函数，现在作为分发器。
     """
-    from .manager import scheduler_manager
+    scheduler_manager = _get_scheduler_manager()
 
     schedule = None
 
@@ -342,17 +798,7 @@ async def _execute_job(
         try:
             bot = nonebot.get_bot()
             logger.info(f"开始执行临时任务: {plugin_name}")
-            injected_params = {"context": context_override}
-            state: T_State = {ScheduleContext: context_override}
-
-            async def wrapper(bot: Bot):
-                return await task_meta["func"](bot=bot, **injected_params)  # type: ignore
-
-            dependent = Dependent.parse(
-                call=wrapper,
-                allow_types=Matcher.HANDLER_PARAM_TYPES,
-            )
-            await dependent(bot=bot, state=state)
+            await task_meta["func"](bot=bot, context=context_override)
             logger.info(f"临时任务 '{plugin_name}' 执行完成。")
         except Exception as e:
             logger.error(f"执行临时任务 '{plugin_name}' 时发生错误", e=e)
@@ -364,25 +810,29 @@ async def _execute_job(
 
     scheduler_manager._running_tasks.add(schedule_id)
     try:
-        schedule = await ScheduleRepository.get_by_id(schedule_id)
+        schedule = await _load_schedule(schedule_id)
         if not schedule or (not schedule.is_enabled and not force):
             logger.warning(f"定时任务 {schedule_id} 不存在或已禁用，跳过执行。")
             return
+        _apply_pending_run_status(schedule)
 
-        try:
-            bot = (
-                nonebot.get_bot(schedule.bot_id)
-                if schedule.bot_id
-                else nonebot.get_bot()
-            )
-        except (KeyError, ValueError):
+        bots = nonebot.get_bots()
+        bot = (
+            bots.get(schedule.bot_id)
+            if schedule.bot_id
+            else next(iter(bots.values()), None)
+        )
+        if bot is None:
             logger.warning(
                 f"任务 {schedule_id} 需要的 Bot {schedule.bot_id} "
                 f"不在线，本次执行跳过。"
             )
-            raise
+            raise ValueError(f"Bot {schedule.bot_id} 不在线")
 
-        resolver = scheduler_manager._target_resolvers.get(schedule.target_type)
+        target_type = schedule.target_type
+        if target_type not in _CANONICAL_TARGETS:
+            target_type = target_type.upper()
+        resolver = scheduler_manager._target_resolvers.get(target_type)
         if not resolver:
             logger.error(
                 f"任务 {schedule.id} 的目标类型 '{schedule.target_type}' "
@@ -390,11 +840,19 @@ async def _execute_job(
             )
             raise ValueError(f"未知的目标类型: {schedule.target_type}")
 
-        try:
-            resolved_targets = await resolver(schedule.target_identifier, bot)
-        except Exception as e:
-            logger.error(f"为任务 {schedule.id} 解析目标失败", e=e)
-            raise
+        if await _is_task_blocked(bot, schedule.plugin_name):
+            # 全局或Bot级别已禁用时，所有目标都会被跳过，无需再解析和分发
+            logger.info(
+                f"插件 '{schedule.plugin_name}' 的定时任务 (ID: {schedule.id}) "
+                f"因功能被全局禁用而跳过执行。"
+            )
+            resolved_targets = []
+        else:
+            try:
+                resolved_targets = await resolver(schedule.target_identifier, bot)
+            except Exception as e:
+                logger.error(f"为任务 {schedule.id} 解析目标失败", e=e)
+                raise
 
         logger.info(
             f"任务 {schedule.id} ({schedule.name or schedule.plugin_name}) 开始执行, "
@@ -402,10 +860,34 @@ async def _execute_job(
             f"解析出 {len(resolved_targets)} 个目标"
         )
 
-        concurrency_limit = Config.get_config(
-            "SchedulerManager", SCHEDULE_CONCURRENCY_KEY, 5
+        task_meta = scheduler_manager._registered_tasks.get(schedule.plugin_name)
+        if not task_meta:
+            logger.error(
+                f"无法执行任务：插件 '{schedule.plugin_name}' 在执行期间变得不可用。"
+            )
+            raise ValueError(f"未注册的定时任务插件: {schedule.plugin_name}")
+
+        # 执行策略与参数验证对所有目标都相同，每次调度只做一次
+        policy, job_kwargs = _split_execution_policy(schedule)
+        params = _validate_job_params(schedule, task_meta, job_kwargs)
+
+        if len(group_targets := [t for t in resolved_targets if t]) > 1:
+            resolved_targets = await _filter_blocked_targets(
+                bot, schedule, resolved_targets, group_targets
+            )
+
+        # 多目标分发时只输出整体的开始与结束日志，不再逐目标输出
+        is_fan_out = len(resolved_targets) > 1
+        run_target = partial(
+            _execute_single_job_instance,
+            schedule,
+            bot,
+            func=task_meta["func"],
+            params=params,
+            policy=policy,
+            job_kwargs=job_kwargs,
+            log_start=not is_fan_out,
         )
-        semaphore = asyncio.Semaphore(concurrency_limit if concurrency_limit > 0 else 5)
 
         spread_config = (
             schedule.execution_options
@@ -413,22 +895,34 @@ async def _execute_job(
             else {}
         )
         interval_seconds = spread_config.get("interval")
+        # 逐目标的调试日志只在调试级别开启时才构建
+        debug_enabled = logger.is_enabled_for("DEBUG")
 
-        if interval_seconds is not None and interval_seconds > 0:
+        if len(resolved_targets) == 1:
+            # 单目标（全局或单个群组）是最常见的情况，无需间隔、分散或并发控制
+            await run_target(group_id=resolved_targets[0])
+        elif interval_seconds is not None and interval_seconds > 0:
             logger.debug(
                 f"任务 {schedule.id}: 使用串行模式执行 {len(resolved_targets)} "
                 f"个目标，固定间隔 {interval_seconds} 秒。"
             )
             for i, target_id in enumerate(resolved_targets):
                 if i > 0:
-                    logger.debug(
-                        f"任务 {schedule.id} 目标 [{target_id or '全局'}]: "
-                        f"等待 {interval_seconds} 秒后执行。"
-                    )
+                    if debug_enabled:
+                        logger.debug(
+                            f"任务 {schedule.id} 目标 [{target_id or '全局'}]: "
+                            f"等待 {interval_seconds} 秒后执行。"
+                        )
                     await asyncio.sleep(interval_seconds)
-                await _execute_single_job_instance(schedule, bot, group_id=target_id)
+                await run_target(group_id=target_id)
         else:
             spread_seconds = spread_config.get("spread", 1.0)
+            concurrency_limit = Config.get_config(
+                "SchedulerManager", SCHEDULE_CONCURRENCY_KEY, 5
+            )
+            admission = await _get_admission_controller(
+                schedule.id, concurrency_limit if concurrency_limit > 0 else 5
+            )
 
             logger.debug(
                 f"任务 {schedule.id}: 将在 {spread_seconds:.2f} 秒内分散执行 "
@@ -436,27 +930,50 @@ async def _execute_job(
             )
 
             async def worker(target_id: str | None):
-                delay = random.uniform(0.1, spread_seconds)
-                logger.debug(
-                    f"任务 {schedule.id} 目标 [{target_id or '全局'}]: "
-                    f"随机延迟 {delay:.2f} 秒后执行。"
-                )
-                await asyncio.sleep(delay)
-                async with semaphore:
-                    await _execute_single_job_instance(
-                        schedule, bot, group_id=target_id
+                async with admission:
+                    await run_target(group_id=target_id)
+
+            # 预先生成并排序所有随机延迟，由单个循环按时间顺序依次派发，
+            # 避免为每个目标各自挂起一个 sleep 定时器
+            delays = sorted(
+                (random.uniform(0.1, spread_seconds), index)
+                for index in range(len(resolved_targets))
+            )
+            # 已完成的目标会立即从集合中移除，释放其协程帧，而不是等到全部结束
+            running_targets: set[asyncio.Task] = set()
+
+            def on_target_done(task: asyncio.Task):
+                running_targets.discard(task)
+                if not task.cancelled() and (exc := task.exception()):
+                    logger.error(f"任务 {schedule.id} 的目标执行出现未处理异常", e=exc)
+
+            elapsed = 0.0
+            for delay, index in delays:
+                target_id = resolved_targets[index]
+                if debug_enabled:
+                    logger.debug(
+                        f"任务 {schedule.id} 目标 [{target_id or '全局'}]: "
+                        f"随机延迟 {delay:.2f} 秒后执行。"
                     )
-
-            tasks_to_run = [worker(target_id) for target_id in resolved_targets]
-            if tasks_to_run:
-                await asyncio.gather(*tasks_to_run, return_exceptions=True)
+                await asyncio.sleep(delay - elapsed)
+                elapsed = delay
+                task = asyncio.create_task(worker(target_id))
+                running_targets.add(task)
+                task.add_done_callback(on_target_done)
+            if running_targets:
+                await asyncio.wait(running_targets)
+
+        if is_fan_out:
+            logger.info(
+                f"任务 {schedule.id} ({schedule.name or schedule.plugin_name}) "
+                f"已完成 {len(resolved_targets)} 个目标的分发执行。"
+            )
 
         schedule.last_run_at = datetime.now()
         schedule.last_run_status = "SUCCESS"
         schedule.consecutive_failures = 0
-        await schedule.save(
-            update_fields=["last_run_at", "last_run_status", "consecutive_failures"]
-        )
+        if not schedule.is_one_off:
+            _queue_run_status_update(schedule)
 
         if schedule.is_one_off:
             logger.info(f"一次性任务 {schedule.id} 执行成功，将被删除。")
@@ -472,10 +989,10 @@ async def _execute_job(
         if schedule:
             schedule.last_run_at = datetime.now()
             schedule.last_run_status = "FAILURE"
-            schedule.consecutive_failures = (schedule.consecutive_failures or 0) + 1
-            await schedule.save(
-                update_fields=["last_run_at", "last_run_status", "consecutive_failures"]
-            )
+            try:
+                await _record_run_failure(schedule)
+            except Exception as save_error:
+                logger.error(f"写入任务 {schedule_id} 的失败状态时出错", e=save_error)
 
     finally:
         if schedule_id is not None:
@@ -6,9 +6,8 @@
 
 from zhenxun.services.log import logger
 from zhenxun.utils.manager.priority_manager import PriorityLifecycle
-from zhenxun.utils.pydantic_compat import model_dump
 
-from .engine import APSchedulerAdapter
+from .engine import APSchedulerAdapter, flush_run_status_updates
 from .manager import scheduler_manager
 from .repository import ScheduleRepository
 from .types import ScheduleContext
@@ -30,24 +29,20 @@ async def _load_schedules_from_db():
 
     logger.info("正在检查并注册声明式默认任务...")
     declared_count = 0
+    existing_keys = await ScheduleRepository.get_existing_keys(
+        list({task_info.plugin_name for task_info in scheduler_manager._declared_tasks})
+    )
     for task_info in scheduler_manager._declared_tasks:
         plugin_name = task_info.plugin_name
         group_id = task_info.group_id
         bot_id = task_info.bot_id
 
-        query_kwargs = {
-            "plugin_name": plugin_name,
-            "target_identifier": group_id or "",
-            "bot_id": bot_id,
-        }
-        exists = await ScheduleRepository.exists(**query_kwargs)
-
-        if not exists:
+        task_key = (plugin_name, group_id or "", bot_id)
+        if task_key not in existing_keys:
+            existing_keys.add(task_key)
             logger.info(f"为插件 '{plugin_name}' 注册新的默认定时任务...")
 
-            trigger_config_dict = model_dump(
-                task_info.trigger, exclude={"trigger_type"}
-            )
+            trigger_config_dict = task_info.trigger.to_config()
 
             target_type = "GROUP" if group_id else "GLOBAL"
             target_identifier = group_id or ""
@@ -86,9 +81,7 @@ async def _load_schedules_from_db():
                 job_kwargs={},
             )
 
-            trigger_config_dict = model_dump(
-                declaration.trigger, exclude={"trigger_type"}
-            )
+            trigger_config_dict = declaration.trigger.to_config()
 
             APSchedulerAdapter.add_ephemeral_job(
                 job_id=job_id,
@@ -103,3 +96,9 @@ async def _load_schedules_from_db():
 
     if ephemeral_count > 0:
         logger.info(f"临时任务调度完成，共成功加载 {ephemeral_count} 个任务。")
+
+
+@PriorityLifecycle.on_shutdown(priority=90)
+async def _flush_pending_run_status():
+    """在服务关闭前写回尚未落库的任务执行状态。"""
+    await flush_run_status_updates()
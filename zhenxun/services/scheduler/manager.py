@@ -9,21 +9,20 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable, Coroutine
 from datetime import datetime
-import inspect
 from typing import Any, ClassVar
 import uuid
 
 from arclet.alconna import Alconna, Option
 import nonebot
 from nonebot.adapters import Bot
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from zhenxun.configs.config import Config
 from zhenxun.models.scheduled_job import ScheduledJob
 from zhenxun.services.log import logger
 from zhenxun.utils.pydantic_compat import model_dump, model_validate
 
-from .engine import APSchedulerAdapter
+from .engine import _CANONICAL_TARGETS, APSchedulerAdapter, _execute_job
 from .repository import ScheduleRepository
 from .targeting import (
     ScheduleTargeter,
@@ -37,6 +36,16 @@ from .types import (
     ScheduledJobDeclaration,
 )
 
+_DEFAULT_EXECUTION_OPTIONS = model_dump(ExecutionOptions(), exclude_none=True)
+"""未提供执行选项时使用的默认值"""
+
+_SCHEDULE_FIELDS = tuple(ScheduledJob._meta.fields_map)
+"""ScheduledJob 的字段名，用于构建状态字典"""
+
+_STATUS_RUNNING = "运行中"
+_STATUS_ENABLED = "启用"
+_STATUS_PAUSED = "暂停"
+
 
 class SchedulerManager:
     ALL_GROUPS: ClassVar[str] = "__ALL_GROUPS__"
@@ -83,9 +92,10 @@ class SchedulerManager:
         """
         注册一个新的目标类型解析器。
         """
-        if target_type in self._target_resolvers:
+        key = target_type if target_type in _CANONICAL_TARGETS else target_type.upper()
+        if key in self._target_resolvers:
             logger.warning(f"目标解析器 '{target_type}' 已存在，将被覆盖。")
-        self._target_resolvers[target_type.upper()] = resolver_func
+        self._target_resolvers[key] = resolver_func
         logger.info(f"已注册新的定时任务目标解析器: '{target_type}'")
 
     def target(self, **filters: Any) -> ScheduleTargeter:
@@ -123,15 +133,17 @@ class SchedulerManager:
                 plugin_name = plugin.name
 
                 params_model = None
-                from .types import ScheduleContext
-
-                for param in inspect.signature(func).parameters.values():
+                # 直接读取 __annotations__，无需构建完整的 Signature 对象
+                for param_name, annotation in getattr(
+                    func, "__annotations__", {}
+                ).items():
                     if (
-                        isinstance(param.annotation, type)
-                        and issubclass(param.annotation, BaseModel)
-                        and param.annotation is not ScheduleContext
+                        param_name != "return"
+                        and isinstance(annotation, type)
+                        and issubclass(annotation, BaseModel)
+                        and annotation is not ScheduleContext
                     ):
-                        params_model = param.annotation
+                        params_model = annotation
                         break
 
                 if plugin_name in self._registered_tasks:
@@ -258,7 +270,7 @@ class SchedulerManager:
             job_id=job_id,
             func=func,
             trigger_type=trigger.trigger_type,
-            trigger_config=model_dump(trigger, exclude={"trigger_type"}),
+            trigger_config=trigger.to_config(),
             context=context,
         )
         logger.info(f"已动态调度一个临时任务 (ID: {job_id})，将在 {trigger} 触发。")
@@ -296,13 +308,14 @@ class SchedulerManager:
             target_type=target_type,
             target_identifier=target_identifier,
             trigger_type=trigger.trigger_type,
-            trigger_config=model_dump(trigger, exclude={"trigger_type"}),
+            trigger_config=trigger.to_config(),
             job_kwargs=job_kwargs,
             bot_id=bot_id,
             name=name,
             created_by=created_by,
             required_permission=required_permission,
             is_one_off=True,
+            is_new=True,
         )
 
     async def add_daily_task(
@@ -374,8 +387,6 @@ class SchedulerManager:
         self, plugin_name: str, job_kwargs: dict | None
     ) -> tuple[bool, str | dict]:
         """验证并准备任务参数，应用默认值"""
-        from pydantic import ValidationError
-
         task_meta = self._registered_tasks.get(plugin_name)
         if not task_meta:
             return False, f"插件 '{plugin_name}' 未注册。"
@@ -420,6 +431,7 @@ class SchedulerManager:
         source: str = "USER",
         is_one_off: bool = False,
         execution_options: dict | None = None,
+        is_new: bool = False,
     ) -> "ScheduledJob | None":
         """
         添加定时任务（通用方法）
@@ -438,6 +450,7 @@ class SchedulerManager:
             source: 任务来源 (USER, PLUGIN_DEFAULT)。
             is_one_off: 是否为一次性任务。
             execution_options: 任务执行的额外选项 (例如: jitter, spread)。
+            is_new: 调用方确认任务必然不存在时为True，跳过查询直接创建。
 
         返回:
             ScheduledJob | None: 创建的任务信息，失败时返回None。
@@ -451,8 +464,11 @@ class SchedulerManager:
             logger.error(f"任务参数校验失败: {result}")
             return None
 
-        options_dict = execution_options or {}
-        validated_options = ExecutionOptions(**options_dict)
+        options_dump = (
+            model_dump(ExecutionOptions(**execution_options), exclude_none=True)
+            if execution_options
+            else dict(_DEFAULT_EXECUTION_OPTIONS)
+        )
 
         search_kwargs = {
             "plugin_name": plugin_name,
@@ -463,23 +479,28 @@ class SchedulerManager:
             search_kwargs["bot_id"] = bot_id
 
         defaults = {
-            "name": name,
             "trigger_type": trigger_type,
             "trigger_config": trigger_config,
             "job_kwargs": result,
             "is_enabled": True,
-            "created_by": created_by,
             "required_permission": required_permission,
             "source": source,
             "is_one_off": is_one_off,
-            "execution_options": model_dump(validated_options, exclude_none=True),
+            "execution_options": options_dump,
         }
-
-        defaults = {k: v for k, v in defaults.items() if v is not None}
-
-        schedule, created = await ScheduleRepository.update_or_create(
-            defaults, **search_kwargs
-        )
+        # 只有这两个字段可能为 None，单独判断即可，无需再过滤整个字典
+        if name is not None:
+            defaults["name"] = name
+        if created_by is not None:
+            defaults["created_by"] = created_by
+
+        if is_new:
+            schedule = await ScheduleRepository.create(**search_kwargs, **defaults)
+            created = True
+        else:
+            schedule, created = await ScheduleRepository.update_or_create(
+                defaults, **search_kwargs
+            )
         APSchedulerAdapter.add_or_reschedule_job(schedule)
 
         action_str = "创建" if created else "更新"
@@ -494,36 +515,41 @@ class SchedulerManager:
         """
         根据条件获取定时任务列表
         """
-        cleaned_filters = {k: v for k, v in filters.items() if v is not None}
+        # None 值的过滤由 query_schedules 统一处理
         return await ScheduleRepository.query_schedules(
-            page=page, page_size=page_size, **cleaned_filters
+            page=page, page_size=page_size, **filters
         )
 
     async def get_schedules_status_bulk(
-        self, schedule_ids: list[int]
+        self, schedule_ids: list[int], fields: tuple[str, ...] | None = None
     ) -> list[dict[str, Any]]:
         """
         批量获取多个定时任务的详细状态信息
+
+        参数:
+            schedule_ids: 任务ID列表。
+            fields: 需要包含的任务字段，None表示包含全部字段。
+
+        返回:
+            list[dict[str, Any]]: 按传入ID顺序排列的状态字典列表。
         """
         if not schedule_ids:
             return []
 
-        schedules = await ScheduleRepository.filter(id__in=schedule_ids).all()
-        schedule_map = {s.id: s for s in schedules}
+        schedule_map = await ScheduleRepository.get_by_ids(schedule_ids)
+        scheduler_statuses = APSchedulerAdapter.get_job_statuses(list(schedule_map))
+        field_names = fields or _SCHEDULE_FIELDS
+        running = self._running_tasks
 
         statuses = []
         for schedule_id in schedule_ids:
             if schedule := schedule_map.get(schedule_id):
-                status_from_scheduler = APSchedulerAdapter.get_job_status(schedule.id)
-                status_dict = {
-                    field: getattr(schedule, field)
-                    for field in schedule._meta.fields_map
-                }
-                status_dict.update(status_from_scheduler)
+                status_dict = {field: getattr(schedule, field) for field in field_names}
+                status_dict.update(scheduler_statuses[schedule_id])
                 status_dict["is_enabled"] = (
-                    "运行中"
-                    if schedule_id in self._running_tasks
-                    else ("启用" if schedule.is_enabled else "暂停")
+                    _STATUS_RUNNING
+                    if schedule_id in running
+                    else (_STATUS_ENABLED if schedule.is_enabled else _STATUS_PAUSED)
                 )
                 statuses.append(status_dict)
 
@@ -587,9 +613,9 @@ class SchedulerManager:
         status_from_scheduler = APSchedulerAdapter.get_job_status(schedule.id)
 
         status_text = (
-            "运行中"
+            _STATUS_RUNNING
             if schedule_id in self._running_tasks
-            else ("启用" if schedule.is_enabled else "暂停")
+            else (_STATUS_ENABLED if schedule.is_enabled else _STATUS_PAUSED)
         )
 
         return {
@@ -609,34 +635,26 @@ class SchedulerManager:
         """
         暂停指定的定时任务
         """
-        schedule = await ScheduleRepository.get_by_id(schedule_id)
-        if not schedule or not schedule.is_enabled:
+        if not await ScheduleRepository.set_enabled(schedule_id, False):
             return False, "任务不存在或已暂停。"
 
-        schedule.is_enabled = False
-        await ScheduleRepository.save(schedule, update_fields=["is_enabled"])
         APSchedulerAdapter.pause_job(schedule_id)
-        return True, f"已暂停任务 (ID: {schedule.id})。"
+        return True, f"已暂停任务 (ID: {schedule_id})。"
 
     async def resume_schedule(self, schedule_id: int) -> tuple[bool, str]:
         """
         恢复指定的定时任务
         """
-        schedule = await ScheduleRepository.get_by_id(schedule_id)
-        if not schedule or schedule.is_enabled:
+        if not await ScheduleRepository.set_enabled(schedule_id, True):
             return False, "任务不存在或已启用。"
 
-        schedule.is_enabled = True
-        await ScheduleRepository.save(schedule, update_fields=["is_enabled"])
         APSchedulerAdapter.resume_job(schedule_id)
-        return True, f"已恢复任务 (ID: {schedule.id})。"
+        return True, f"已恢复任务 (ID: {schedule_id})。"
 
     async def trigger_now(self, schedule_id: int) -> tuple[bool, str]:
         """
         立即手动触发指定的定时任务
         """
-        from .engine import _execute_job
-
         schedule = await ScheduleRepository.get_by_id(schedule_id)
         if not schedule:
             return False, f"未找到 ID 为 {schedule_id} 的定时任务。"
@@ -27,6 +27,42 @@ class ScheduleRepository:
         """
         return await ScheduledJob.get_or_none(id=schedule_id)
 
+    @staticmethod
+    async def get_by_ids(schedule_ids: list[int]) -> dict[int, ScheduledJob]:
+        """
+        通过ID列表批量获取任务
+
+        参数:
+            schedule_ids: 任务ID列表。
+
+        返回:
+            dict[int, ScheduledJob]: 以任务ID为键的任务字典，不存在的ID不会出现。
+        """
+        if not schedule_ids:
+            return {}
+        schedules = await ScheduledJob.filter(id__in=schedule_ids).all()
+        return {schedule.id: schedule for schedule in schedules}
+
+    @staticmethod
+    async def get_existing_keys(
+        plugin_names: list[str],
+    ) -> set[tuple[str, str, str | None]]:
+        """
+        批量获取指定插件已存在任务的 (插件名, 目标标识符, Bot ID) 组合
+
+        参数:
+            plugin_names: 插件名列表。
+
+        返回:
+            set[tuple[str, str, str | None]]: 已存在的任务键集合。
+        """
+        if not plugin_names:
+            return set()
+        rows = await ScheduledJob.filter(plugin_name__in=plugin_names).values_list(
+            "plugin_name", "target_identifier", "bot_id"
+        )
+        return set(rows)  # type: ignore
+
     @staticmethod
     async def get_all_enabled() -> list[ScheduledJob]:
         """
@@ -55,6 +91,25 @@ class ScheduleRepository:
         """
         await schedule.save(update_fields=update_fields)
 
+    @staticmethod
+    async def set_enabled(schedule_id: int, enabled: bool) -> bool:
+        """
+        切换任务的启用状态
+
+        仅当任务当前状态与目标状态相反时才会更新，读取与写入合并为一条语句。
+
+        参数:
+            schedule_id: 任务ID。
+            enabled: 目标启用状态。
+
+        返回:
+            bool: 是否有任务被更新，任务不存在或已处于目标状态时为False。
+        """
+        updated = await ScheduledJob.filter(
+            id=schedule_id, is_enabled=not enabled
+        ).update(is_enabled=enabled)
+        return updated > 0
+
     @staticmethod
     async def exists(**kwargs: Any) -> bool:
         """检查任务是否存在"""
@@ -66,7 +121,7 @@ class ScheduleRepository:
     ) -> list[ScheduledJob]:
         """[DEPRECATED] 根据插件和群组ID列表获取任务"""
         return await ScheduledJob.filter(
-            plugin_name=plugin_name, target_descriptor__in=group_ids
+            plugin_name=plugin_name, target_identifier__in=group_ids
         ).all()
 
     @staticmethod
@@ -76,6 +131,11 @@ class ScheduleRepository:
         """更新或创建任务"""
         return await ScheduledJob.update_or_create(defaults=defaults, **kwargs)
 
+    @staticmethod
+    async def create(**kwargs: Any) -> ScheduledJob:
+        """直接创建任务，调用方需保证不会与已有任务冲突"""
+        return await ScheduledJob.create(**kwargs)
+
     @staticmethod
     async def query_schedules(
         page: int | None = None, page_size: int | None = None, **filters: Any
@@ -3,16 +3,30 @@
 """
 
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from zhenxun.utils.pydantic_compat import model_dump
 
 
 class BaseTrigger(BaseModel):
     """触发器配置的基类"""
 
     trigger_type: str = Field(..., exclude=True)
+    _config_cache: dict[str, Any] | None = PrivateAttr(default=None)
+
+    def to_config(self) -> dict[str, Any]:
+        """
+        获取传递给 APScheduler 的触发器配置字典
+
+        首次调用时序列化并缓存结果，之后返回缓存的副本。
+        """
+        if self._config_cache is None:
+            self._config_cache = model_dump(self, exclude={"trigger_type"})
+        return dict(self._config_cache)
 
 
 class CronTrigger(BaseTrigger):
@@ -127,8 +141,9 @@ class ExecutionPolicy(BaseModel):
         arbitrary_types_allowed = True
 
 
-class ScheduledJobDeclaration(BaseModel):
-    """用于在启动时声明默认定时任务的内部数据模型"""
+@dataclass(frozen=True, slots=True)
+class ScheduledJobDeclaration:
+    """用于在启动时声明默认定时任务的内部数据结构"""
 
     plugin_name: str
     group_id: str | None
@@ -136,16 +151,11 @@ class ScheduledJobDeclaration(BaseModel):
     trigger: BaseTrigger
     job_kwargs: dict[str, Any]
 
-    class Config:
-        arbitrary_types_allowed = True
 
-
-class EphemeralJobDeclaration(BaseModel):
-    """用于在启动时声明临时任务的内部数据模型"""
+@dataclass(frozen=True, slots=True)
+class EphemeralJobDeclaration:
+    """用于在启动时声明临时任务的内部数据结构"""
 
     plugin_name: str
     func: Callable[..., Awaitable[Any]]
     trigger: BaseTrigger
-
-    class Config:
-        arbitrary_types_allowed = True
@@ -515,8 +515,14 @@ class TagManager:
         """
         if name == "@all":
             if bot:
-                all_groups, _ = await PlatformUtils.get_group_list(bot)
-                return [str(g.group_id) for g in all_groups if g.group_id]
+                # 频道与其所属群组共享 group_id，只遍历群组即可，
+                # 同时避免逐群请求频道列表
+                group_ids = {
+                    str(g.group_id): None
+                    async for g in PlatformUtils.iter_group_list(bot, only_group=True)
+                    if g.group_id
+                }
+                return list(group_ids)
             else:
                 all_group_ids = await GroupConsole.all().values_list(
                     "group_id", flat=True
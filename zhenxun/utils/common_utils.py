@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 import re
 from typing import overload
 
@@ -26,14 +27,7 @@ class CommonUtils:
         返回:
             bool: 是否可以发送
         """
-        if isinstance(session, Bot):
-            if interface := get_interface(session):
-                info = interface.basic_info()
-                if info["scope"] == SupportScope.qq_api:
-                    logger.info("q官bot放弃所有被动技能发言...")
-                    """q官bot放弃所有被动技能发言"""
-                    return False
-        if session.scene == SupportScope.qq_api:
+        if cls._is_qq_api(session):
             """q官bot放弃所有被动技能发言"""
             logger.info("q官bot放弃所有被动技能发言...")
             return False
@@ -56,13 +50,50 @@ class CommonUtils:
                 return True
             if g := await GroupConsole.get_group(group_id=group_id):
                 """群组权限是否小于0"""
-                if g.level < 0:
+                if GroupConsole.is_level_blocked(g.level):
                     return True
             if await BanConsole.is_ban(None, group_id):
                 """群组是否被ban"""
                 return True
         return False
 
+    @classmethod
+    async def task_is_block_bulk(
+        cls, session: Bot, module: str, group_ids: Iterable[str]
+    ) -> set[str]:
+        """批量判断多个群组的被动技能是否被禁用
+
+        与逐个调用 `task_is_block` 结果一致，但全局与bot状态只检查一次，
+        群组禁用、群权限与群组ban各通过一次查询完成，判断条件由对应模型提供
+
+        参数:
+            module: 被动技能模块名
+            group_ids: 群组id列表
+
+        返回:
+            set[str]: 被禁用的群组id
+        """
+        group_ids = set(group_ids)
+        if not group_ids or cls._is_qq_api(session):
+            return set()
+        if await cls.task_is_block(session, module):
+            return group_ids
+        blocked = await GroupConsole.get_block_task_groups(group_ids, module)
+        if remaining := group_ids - blocked:
+            blocked |= await GroupConsole.get_level_blocked_groups(remaining)
+        if remaining := group_ids - blocked:
+            blocked |= await BanConsole.get_banned_groups(remaining)
+        return blocked
+
+    @staticmethod
+    def _is_qq_api(session: Uninfo | Bot) -> bool:
+        """是否为q官bot"""
+        if isinstance(session, Bot):
+            if interface := get_interface(session):
+                if interface.basic_info()["scope"] == SupportScope.qq_api:
+                    return True
+        return session.scene == SupportScope.qq_api
+
     @staticmethod
     def format(name: str) -> str:
         return f"<{name},"
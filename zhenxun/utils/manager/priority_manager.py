@@ -58,3 +58,23 @@ async def _():
                     func()
     except HookPriorityException as e:
         logger.error(f"打断优先级 [{priority}] on_startup 方法. {type(e)}: {e}")
+
+
+@driver.on_shutdown
+async def _():
+    # 本模块在 bot.py 注册数据库 disconnect 之前就已被导入，
+    # 因此这里的关闭钩子会先于断开数据库连接执行。
+    # 关闭时按优先级倒序执行，与启动顺序相反，保证被依赖的服务最后关闭。
+    priority_data = PriorityLifecycle._data.get(PriorityLifecycleType.SHUTDOWN)
+    if not priority_data:
+        return
+    for priority in sorted(priority_data.keys(), reverse=True):
+        for func in priority_data[priority]:
+            logger.debug(f"执行优先级 [{priority}] on_shutdown 方法: {func.__module__}")
+            try:
+                if is_coroutine_callable(func):
+                    await func()
+                else:
+                    func()
+            except Exception as e:
+                logger.error(f"执行优先级 [{priority}] on_shutdown 方法出错", e=e)
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 import random
 from typing import cast
 
@@ -395,30 +395,40 @@ class PlatformUtils:
         返回:
             tuple[list[GroupConsole], str]: 群组列表, 平台
         """
+        platform = cls.get_platform(bot) if get_interface(bot) else ""
+        result_list = [
+            group async for group in cls.iter_group_list(bot, only_group=only_group)
+        ]
+        return result_list, platform
+
+    @classmethod
+    async def iter_group_list(
+        cls, bot: Bot, only_group: bool = False
+    ) -> AsyncIterator[GroupConsole]:
+        """逐个产出群组，适用于只需遍历一次、无需保留完整列表的场景
+
+        参数:
+            bot: Bot
+            only_group: 是否只获取群组（不获取channel）
+
+        返回:
+            AsyncIterator[GroupConsole]: 群组
+        """
         if not (interface := get_interface(bot)):
-            return [], ""
+            return
         platform = cls.get_platform(bot)
-        result_list = []
         scenes = await interface.get_scenes(SceneType.GROUP)
         for scene in scenes:
             group_id = scene.id
-            result_list.append(
-                GroupConsole(
-                    group_id=scene.id,
-                    group_name=scene.name,
-                )
-            )
+            yield GroupConsole(group_id=scene.id, group_name=scene.name)
             if not only_group and platform != "qq":
                 if channel_list := await interface.get_scenes(parent_scene_id=group_id):
-                    result_list.extend(
-                        GroupConsole(
+                    for channel in channel_list:
+                        yield GroupConsole(
                             group_id=scene.id,
                             group_name=channel.name,
                             channel_id=channel.id,
                         )
-                        for channel in channel_list
-                    )
-        return result_list, platform
 
     @classmethod
     async def update_friend(cls, bot: Bot) -> int: